@@ -1,21 +1,24 @@
 from __future__ import annotations
 
+import asyncio
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 
 from .const import DOMAIN
 from .coordinator import PellaCoordinator
-
-PLATFORMS: list[str] = ["cover", "binary_sensor", "sensor"]
+from .services import async_setup_services
 
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
+    await async_setup_services(hass)
     return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coordinator = PellaCoordinator(hass, entry)
+    coordinator.async_seed_from_restore_state()
     await coordinator.async_start()
 
     # Register the bridge as a device (hub) in the device registry
@@ -32,13 +35,62 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Only platforms for device types already known (restored state); the
+    # rest are loaded when discovery or a push first reports such a point.
+    platforms = coordinator.required_platforms()
+    await hass.config_entries.async_forward_entry_setups(entry, sorted(platforms))
+    coordinator.loaded_platforms.update(platforms)
+
+    @callback
+    def _ensure_platform(platform: str | None) -> None:
+        if platform is None or platform in coordinator.loaded_platforms or platform in coordinator.pending_platforms:
+            return
+        coordinator.pending_platforms[platform] = entry.async_create_background_task(
+            hass, _async_forward_late(hass, entry, coordinator, platform), f"{DOMAIN} forward {platform}"
+        )
+
+    @callback
+    def _on_point(idx: int) -> None:
+        _ensure_platform(coordinator.platform_for_point(idx))
+
+    entry.async_on_unload(coordinator.async_add_point_listener(_on_point))
+    # Points that showed up while the initial platforms were being set up.
+    for platform in coordinator.required_platforms():
+        _ensure_platform(platform)
+    entry.async_on_unload(entry.add_update_listener(_async_options_updated))
     return True
 
 
+async def _async_forward_late(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: PellaCoordinator, platform: str
+) -> None:
+    # Newer cores require the late variant (it takes the entry's setup lock).
+    forward = getattr(hass.config_entries, "async_late_forward_entry_setups", None)
+    if forward is None:
+        forward = hass.config_entries.async_forward_entry_setups
+    try:
+        await forward(entry, [platform])
+    finally:
+        coordinator.pending_platforms.pop(platform, None)
+    coordinator.loaded_platforms.add(platform)
+
+
+async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    coordinator: PellaCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator.async_options_updated()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coordinator: PellaCoordinator = hass.data[DOMAIN][entry.entry_id]
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if pending := list(coordinator.pending_platforms.values()):
+        # Older cores let a late forward finish so its platform can be unloaded.
+        # Newer ones hold the entry's setup lock here, so a late forward is
+        # still waiting for it and is cancelled before it does anything.
+        if hasattr(hass.config_entries, "async_late_forward_entry_setups"):
+            for task in pending:
+                task.cancel()
+        await asyncio.wait(pending)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, sorted(coordinator.loaded_platforms))
     if unload_ok:
         await coordinator.async_stop()
         hass.data[DOMAIN].pop(entry.entry_id, None)
@@ -5,83 +5,59 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DEVICE_GARAGE, DEVICE_LOCK, DEVICE_WINDOW_DOOR, DOMAIN
+from .const import (
+    COVER_OFF_VALUES,
+    DEVICE_GARAGE,
+    DEVICE_LOCK,
+    DEVICE_WINDOW_DOOR,
+    DOMAIN,
+    OPEN_VALUES,
+    UNLOCK_VALUES,
+)
 from .coordinator import PellaCoordinator
-
-OPEN_VALUES = {"01", "05"}
-UNLOCK_VALUES = {"02", "06"}
-COVER_OFF_VALUES = {"04", "05", "06"}
+from .entity import PellaRestorePointEntity
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
     coord: PellaCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[BinarySensorEntity] = []
-    for idx, dev in coord.data.items():
+    def _entities_for(idx: int) -> list[BinarySensorEntity]:
+        dev = coord.data.get(idx)
+        if dev is None:
+            return []
         if dev.device_type in (DEVICE_WINDOW_DOOR, DEVICE_GARAGE):
-            entities.append(PellaContactBinary(coord, entry.entry_id, idx))
-            entities.append(PellaCoverOffBinary(coord, entry.entry_id, idx))
+            classes = (PellaContactBinary, PellaCoverOffBinary)
         elif dev.device_type == DEVICE_LOCK:
-            entities.append(PellaLockBinary(coord, entry.entry_id, idx))
-            entities.append(PellaCoverOffBinary(coord, entry.entry_id, idx))
+            classes = (PellaLockBinary, PellaCoverOffBinary)
+        else:
+            return []
+        return [cls(coord, entry.entry_id, idx) for cls in classes if coord.async_claim_entity(idx, cls._uid_key)]
 
-    async_add_entities(entities, update_before_add=False)
+    entities: list[BinarySensorEntity] = []
+    for idx in list(coord.data):
+        entities.extend(_entities_for(idx))
+    if entities:
+        async_add_entities(entities, update_before_add=False)
+        coord.async_note_entities_added(len(entities))
 
     @callback
-    def _on_update() -> None:
-        existing = {e.unique_id for e in hass.data.setdefault(f"{DOMAIN}_bin_{entry.entry_id}", [])}
-        new = []
-        for idx, dev in coord.data.items():
-            if dev.device_type in (DEVICE_WINDOW_DOOR, DEVICE_GARAGE):
-                for cls in (PellaContactBinary, PellaCoverOffBinary):
-                    ent = cls(coord, entry.entry_id, idx)
-                    if ent.unique_id not in existing:
-                        new.append(ent)
-            elif dev.device_type == DEVICE_LOCK:
-                for cls in (PellaLockBinary, PellaCoverOffBinary):
-                    ent = cls(coord, entry.entry_id, idx)
-                    if ent.unique_id not in existing:
-                        new.append(ent)
+    def _on_point(idx: int) -> None:
+        new = _entities_for(idx)
         if new:
             async_add_entities(new, update_before_add=False)
+            coord.async_note_entities_added(len(new))
 
-    coord.async_add_listener(_on_update)
+    entry.async_on_unload(coord.async_add_point_listener(_on_point))
 
 
-class _BaseBin(BinarySensorEntity):
-    def __init__(self, coord: PellaCoordinator, entry_id: str, idx: int):
-        self.coordinator = coord
-        self._entry_id = entry_id
-        self._idx = idx
-        coord.hass.data.setdefault(f"{DOMAIN}_bin_{entry_id}", []).append(self)
-
-    @property
-    def device_info(self):
-        return self.coordinator.point_device_info(self._idx)
-
-    @property
-    def _dev(self):
-        return self.coordinator.data.get(self._idx)
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        self.async_write_ha_state()
-
-    async def async_added_to_hass(self) -> None:
-        self.async_on_remove(self.coordinator.async_add_listener(self._handle_coordinator_update))
+class _BaseBin(PellaRestorePointEntity, BinarySensorEntity):
+    """Per-point binary sensor."""
 
 
 class PellaContactBinary(_BaseBin):
     _attr_device_class = BinarySensorDeviceClass.OPENING
-
-    @property
-    def unique_id(self) -> str:
-        base = self._dev.point_id if self._dev and self._dev.point_id else f"point_{self._idx:03d}"
-        return f"{self._entry_id}_contact_{base}"
-
-    @property
-    def name(self) -> str:
-        return f"{self._dev.name} Status" if self._dev else f"Point {self._idx:03d} Status"
+    _uid_key = "contact"
+    _name_suffix = "Status"
 
     @property
     def is_on(self) -> bool | None:
@@ -92,15 +68,8 @@ class PellaContactBinary(_BaseBin):
 
 class PellaLockBinary(_BaseBin):
     _attr_device_class = BinarySensorDeviceClass.LOCK
-
-    @property
-    def unique_id(self) -> str:
-        base = self._dev.point_id if self._dev and self._dev.point_id else f"point_{self._idx:03d}"
-        return f"{self._entry_id}_unlocked_{base}"
-
-    @property
-    def name(self) -> str:
-        return f"{self._dev.name} Status" if self._dev else f"Point {self._idx:03d} Status"
+    _uid_key = "unlocked"
+    _name_suffix = "Status"
 
     @property
     def is_on(self) -> bool | None:
@@ -111,15 +80,8 @@ class PellaLockBinary(_BaseBin):
 
 class PellaCoverOffBinary(_BaseBin):
     _attr_device_class = BinarySensorDeviceClass.TAMPER
-
-    @property
-    def unique_id(self) -> str:
-        base = self._dev.point_id if self._dev and self._dev.point_id else f"point_{self._idx:03d}"
-        return f"{self._entry_id}_coveroff_{base}"
-
-    @property
-    def name(self) -> str:
-        return f"{self._dev.name} Tamper" if self._dev else f"Point {self._idx:03d} Tamper"
+    _uid_key = "coveroff"
+    _name_suffix = "Tamper"
 
     @property
     def is_on(self) -> bool | None:
@@ -5,11 +5,12 @@ from dataclasses import dataclass
 from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
+from .const import DOMAIN, REFRESH_BATTERY, REFRESH_BOTH, REFRESH_STATUS
 from .coordinator import PellaCoordinator
+from .entity import PellaPointEntity
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -33,6 +34,33 @@ DESCRIPTIONS: tuple[PellaButtonEntityDescription, ...] = (
 )
 
 
+@dataclass(frozen=True, kw_only=True)
+class PellaBridgeButtonEntityDescription(ButtonEntityDescription):
+    refresh_kind: str
+
+
+BRIDGE_DESCRIPTIONS: tuple[PellaBridgeButtonEntityDescription, ...] = (
+    PellaBridgeButtonEntityDescription(
+        key="refresh_all_status",
+        name="Refresh All Status",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        refresh_kind=REFRESH_STATUS,
+    ),
+    PellaBridgeButtonEntityDescription(
+        key="refresh_all_battery",
+        name="Refresh All Batteries",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        refresh_kind=REFRESH_BATTERY,
+    ),
+    PellaBridgeButtonEntityDescription(
+        key="refresh_all",
+        name="Refresh All",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        refresh_kind=REFRESH_BOTH,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -40,40 +68,55 @@ async def async_setup_entry(
 ) -> None:
     coord: PellaCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[ButtonEntity] = []
-    for idx in coord.data.keys():
-        for desc in DESCRIPTIONS:
-            entities.append(PellaPointButton(coord, entry.entry_id, idx, desc))
+    def _entities_for(idx: int) -> list[ButtonEntity]:
+        return [
+            PellaPointButton(coord, entry.entry_id, idx, desc)
+            for desc in DESCRIPTIONS
+            if coord.async_claim_entity(idx, desc.key)
+        ]
+
+    entities: list[ButtonEntity] = [PellaBridgeButton(coord, entry.entry_id, desc) for desc in BRIDGE_DESCRIPTIONS]
+    for idx in list(coord.data):
+        entities.extend(_entities_for(idx))
 
     async_add_entities(entities)
 
+    @callback
+    def _on_point(idx: int) -> None:
+        new = _entities_for(idx)
+        if new:
+            async_add_entities(new)
 
-class PellaPointButton(ButtonEntity):
-    _attr_has_entity_name = True
+    entry.async_on_unload(coord.async_add_point_listener(_on_point))
 
-    def __init__(self, coordinator: PellaCoordinator, entry_id: str, idx: int, description: PellaButtonEntityDescription) -> None:
+
+class PellaBridgeButton(ButtonEntity):
+    """Bridge-level button that refreshes every known point in one sweep."""
+
+    def __init__(self, coordinator: PellaCoordinator, entry_id: str, description: PellaBridgeButtonEntityDescription) -> None:
         self.coordinator = coordinator
         self._entry_id = entry_id
-        self._idx = idx
         self.entity_description = description
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
-
-    @property
-    def unique_id(self) -> str:
-        dev = self.coordinator.data.get(self._idx)
-        base = dev.point_id if dev and dev.point_id else f"point_{self._idx:03d}"
-        return f"{self._entry_id}_{self.entity_description.key}_{base}"
+        self._attr_unique_id = f"{entry_id}_{description.key}"
+        self._attr_name = f"{coordinator.bridge_name} {description.name}"
 
     @property
     def device_info(self):
-        # Attach to the point device (not the bridge)
-        return self.coordinator.point_device_info(self._idx)
+        return {"identifiers": {(DOMAIN, self.coordinator.bridge_id)}}
 
-    @property
-    def name(self) -> str:
-        dev = self.coordinator.data.get(self._idx)
-        dev_name = dev.name if dev else f"Point {self._idx:03d}"
-        return f"{dev_name} {self.entity_description.name}"
+    async def async_press(self) -> None:
+        await self.coordinator.async_refresh(None, self.entity_description.refresh_kind)
+
+
+class PellaPointButton(PellaPointEntity, ButtonEntity):
+    _follow_coordinator = False
+
+    def __init__(self, coordinator: PellaCoordinator, entry_id: str, idx: int, description: PellaButtonEntityDescription) -> None:
+        self.entity_description = description
+        self._uid_key = description.key
+        self._name_suffix = description.name
+        super().__init__(coordinator, entry_id, idx)
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
 
     async def async_press(self) -> None:
         fn = getattr(self.coordinator, self.entity_description.press_fn)
@@ -2,12 +2,63 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import re
+import time
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 
+from .trace import DIR_RX, DIR_TX, TraceRecorder
+
 _LOGGER = logging.getLogger(__name__)
 
-LineCallback = Callable[[str], Awaitable[None]]
+# Receives (line, monotonic receive time) pairs.
+LinesCallback = Callable[[list[tuple[str, float]]], Awaitable[None]]
+
+RX_OVERFLOW_DROP_OLDEST = "drop_oldest"
+RX_OVERFLOW_BLOCK = "block"
+
+RE_POINTSET = re.compile(r"^!POINTSET-(?P<idx>\d{3}),")
+
+
+class TokenBucket:
+    """Adaptive token bucket pacing outbound commands.
+
+    Refills at `rate` tokens/sec up to `burst`. The rate starts below
+    `max_rate`, creeps up by `increase` per success and halves on each
+    reported failure (garbled reply, or timeouts spread over several
+    queries), so it settles just under what the bridge can handle.
+    """
+
+    def __init__(self, rate: float, burst: float, min_rate: float, max_rate: float, increase: float = 0.25) -> None:
+        self.rate = rate
+        self._burst = burst
+        self._min_rate = min_rate
+        self._max_rate = max_rate
+        self._increase = increase
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self.stats: dict[str, int] = {"waits": 0, "backoffs": 0}
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        self._refill()
+        if self._tokens < 1:
+            self.stats["waits"] += 1
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+            self._refill()
+        self._tokens -= 1
+
+    def on_success(self) -> None:
+        self.rate = min(self._max_rate, self.rate + self._increase)
+
+    def on_failure(self) -> None:
+        self.stats["backoffs"] += 1
+        self.rate = max(self._min_rate, self.rate / 2)
 
 
 @dataclass
@@ -16,54 +67,190 @@ class TelnetClientConfig:
     port: int
     reconnect_min_seconds: int = 2
     reconnect_max_seconds: int = 60
+    trace_path: str | None = None
+    trace_max_bytes: int = 1_000_000
+    trace_backups: int = 2
+    offline_queue_size: int = 32
+    offline_queue_max_age: float = 30.0
+    rx_queue_size: int = 256
+    rx_overflow: str = RX_OVERFLOW_DROP_OLDEST
+    # Max commands/sec; 0 disables pacing.
+    send_rate_max: float = 10.0
+    send_rate_min: float = 1.0
+    # Pacing starts at this fraction of send_rate_max and probes upward.
+    send_rate_start_fraction: float = 0.5
+    send_burst: float = 3.0
 
 
 class TelnetClient:
-    def __init__(self, cfg: TelnetClientConfig, on_line: LineCallback):
+    def __init__(self, cfg: TelnetClientConfig, on_lines: LinesCallback):
         self._cfg = cfg
-        self._on_line = on_line
+        self._on_lines = on_lines
 
         self._reader: asyncio.StreamReader | None = None
         self._writer: asyncio.StreamWriter | None = None
 
         self._task: asyncio.Task | None = None
+        self._dispatch_task: asyncio.Task | None = None
         self._stop = asyncio.Event()
         self._connected = asyncio.Event()
         self._write_lock = asyncio.Lock()
 
+        # !POINTSET commands issued while disconnected, keyed by point so
+        # only the latest target survives. Values are (command, queued_at).
+        self._offline: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._flushing = False
+        self.queue_stats: dict[str, int] = {
+            "queued": 0,
+            "coalesced": 0,
+            "expired": 0,
+            "dropped": 0,
+            "flushed": 0,
+        }
+
+        # The socket reader only enqueues; a separate dispatcher drains whatever
+        # is queued and hands it to on_lines as one batch. Items are
+        # (line, monotonic receive time).
+        self._rx_queue: asyncio.Queue[tuple[str, float]] = asyncio.Queue(maxsize=cfg.rx_queue_size)
+        self.rx_stats: dict[str, float] = {
+            "lines": 0,
+            "batches": 0,
+            "max_batch": 0,
+            "max_depth": 0,
+            "overflow_dropped": 0,
+            "last_lag_ms": 0.0,
+            "max_lag_ms": 0.0,
+        }
+
+        self._pacer: TokenBucket | None = None
+        if cfg.send_rate_max > 0:
+            min_rate = min(cfg.send_rate_min, cfg.send_rate_max)
+            self._pacer = TokenBucket(
+                rate=max(min_rate, cfg.send_rate_max * cfg.send_rate_start_fraction),
+                burst=cfg.send_burst,
+                min_rate=min_rate,
+                max_rate=cfg.send_rate_max,
+            )
+
+        self._trace: TraceRecorder | None = None
+        if cfg.trace_path:
+            self._trace = TraceRecorder(cfg.trace_path, cfg.trace_max_bytes, cfg.trace_backups)
+
     @property
     def is_connected(self) -> bool:
         return self._connected.is_set()
 
+    @property
+    def pacer(self) -> TokenBucket | None:
+        return self._pacer
+
+    def note_reply_ok(self) -> None:
+        """A query got a well-formed reply; let the pacer probe upward."""
+        if self._pacer:
+            self._pacer.on_success()
+
+    def note_reply_error(self) -> None:
+        """The bridge looks overloaded (garbled reply, widespread timeouts); slow down."""
+        if self._pacer:
+            self._pacer.on_failure()
+
+    async def wait_connected(self, timeout: float) -> bool:
+        """Wait up to timeout seconds for the socket to connect."""
+        try:
+            await asyncio.wait_for(self._connected.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
     async def start(self) -> None:
         self._stop.clear()
+        self._dispatch_task = asyncio.create_task(self._dispatch_loop(), name="pella_insynctive_dispatch")
         self._task = asyncio.create_task(self._run(), name="pella_insynctive_telnet")
 
     async def stop(self) -> None:
         self._stop.set()
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
+        for task in (self._task, self._dispatch_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._task = None
+        self._dispatch_task = None
         await self._close()
+        if self._trace:
+            await self._trace.aclose()
 
     async def send(self, command: str) -> None:
         line = command.strip()
         if not line:
             return
         async with self._write_lock:
+            # While the offline queue is being flushed, new shade targets join
+            # it so they can't go out ahead of a stale one for the same point.
+            if not self._writer or (self._flushing and RE_POINTSET.match(line)):
+                self._enqueue_offline(line)
+                return
+            await self._write(line)
+
+    async def _write(self, line: str) -> None:
+        """Pace and write one line; the caller holds _write_lock."""
+        if self._pacer:
+            await self._pacer.acquire()
             if not self._writer:
-                _LOGGER.debug("TX dropped (not connected): %s", line)
+                self._enqueue_offline(line)
                 return
-            self._writer.write((line + "\r\n").encode("utf-8", errors="ignore"))
-            try:
-                await self._writer.drain()
-                _LOGGER.debug("TX: %s", line)
-            except Exception as err:
-                _LOGGER.debug("TX failed, closing: %s", err)
-                await self._close()
+        assert self._writer is not None
+        self._writer.write((line + "\r\n").encode("utf-8", errors="ignore"))
+        try:
+            await self._writer.drain()
+            _LOGGER.debug("TX: %s", line)
+            if self._trace:
+                self._trace.record(DIR_TX, line)
+        except Exception as err:
+            _LOGGER.debug("TX failed, closing: %s", err)
+            await self._close()
+
+    def _enqueue_offline(self, line: str) -> None:
+        m = RE_POINTSET.match(line)
+        if not m or self._cfg.offline_queue_size <= 0:
+            _LOGGER.debug("TX dropped (not connected): %s", line)
+            return
+
+        key = m.group("idx")
+        if key in self._offline:
+            del self._offline[key]
+            self.queue_stats["coalesced"] += 1
+        elif len(self._offline) >= self._cfg.offline_queue_size:
+            dropped, _ = self._offline.popitem(last=False)[1]
+            self.queue_stats["dropped"] += 1
+            _LOGGER.debug("Offline queue full; dropped %s", dropped)
+        self._offline[key] = (line, time.monotonic())
+        self.queue_stats["queued"] += 1
+        _LOGGER.debug("TX queued until reconnect: %s", line)
+
+    async def _flush_offline(self) -> None:
+        if not self._offline:
+            return
+        self._flushing = True
+        try:
+            # Drain oldest first; targets sent meanwhile are coalesced into the
+            # queue by send() and go out in turn.
+            while self._offline and self._writer:
+                async with self._write_lock:
+                    if not self._offline or not self._writer:
+                        break
+                    key, (line, queued_at) = self._offline.popitem(last=False)
+                    if time.monotonic() - queued_at > self._cfg.offline_queue_max_age:
+                        self.queue_stats["expired"] += 1
+                        _LOGGER.debug("Offline command expired: %s", line)
+                        continue
+                    await self._write(line)
+                    self.queue_stats["flushed"] += 1
+        finally:
+            # Anything left (connection lost mid-flush) waits for the next connect.
+            self._flushing = False
 
     async def _run(self) -> None:
         backoff = self._cfg.reconnect_min_seconds
@@ -71,6 +258,7 @@ class TelnetClient:
             try:
                 await self._connect()
                 backoff = self._cfg.reconnect_min_seconds
+                await self._flush_offline()
                 await self._read_loop()
             except asyncio.CancelledError:
                 raise
@@ -118,4 +306,43 @@ class TelnetClient:
             if not line:
                 continue
             _LOGGER.debug("RX: %s", line)
-            await self._on_line(line)
+            if self._trace:
+                self._trace.record(DIR_RX, line)
+            await self._enqueue_rx(line)
+
+    @property
+    def rx_queue_depth(self) -> int:
+        return self._rx_queue.qsize()
+
+    async def _enqueue_rx(self, line: str) -> None:
+        item = (line, time.monotonic())
+        if self._cfg.rx_overflow == RX_OVERFLOW_BLOCK:
+            await self._rx_queue.put(item)
+        else:
+            if self._rx_queue.full():
+                dropped, _ = self._rx_queue.get_nowait()
+                self.rx_stats["overflow_dropped"] += 1
+                _LOGGER.debug("RX queue full; dropped %s", dropped)
+            self._rx_queue.put_nowait(item)
+        depth = self._rx_queue.qsize()
+        if depth > self.rx_stats["max_depth"]:
+            self.rx_stats["max_depth"] = depth
+
+    async def _dispatch_loop(self) -> None:
+        while True:
+            batch = [await self._rx_queue.get()]
+            while not self._rx_queue.empty():
+                batch.append(self._rx_queue.get_nowait())
+
+            lag_ms = round((time.monotonic() - batch[0][1]) * 1000, 1)
+            stats = self.rx_stats
+            stats["lines"] += len(batch)
+            stats["batches"] += 1
+            stats["max_batch"] = max(stats["max_batch"], len(batch))
+            stats["last_lag_ms"] = lag_ms
+            stats["max_lag_ms"] = max(stats["max_lag_ms"], lag_ms)
+
+            try:
+                await self._on_lines(batch)
+            except Exception:
+                _LOGGER.exception("Error handling RX batch")
@@ -5,19 +5,30 @@ from homeassistant import config_entries
 from homeassistant.core import callback
 
 from .const import CONF_HOST, CONF_PORT, DEFAULT_PORT, DOMAIN
+from .probe import async_probe_bridge
 
 
 class PellaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
 
     async def async_step_user(self, user_input=None):
+        errors: dict[str, str] = {}
         if user_input is not None:
             host = user_input[CONF_HOST].strip()
             port = int(user_input.get(CONF_PORT, DEFAULT_PORT))
-            return self.async_create_entry(
-                title=f"Pella Insynctive ({host})",
-                data={CONF_HOST: host, CONF_PORT: port},
-            )
+            try:
+                probe = await async_probe_bridge(host, port)
+            except (ConnectionError, OSError):
+                errors["base"] = "cannot_connect"
+            else:
+                if not probe.responded:
+                    errors["base"] = "no_response"
+                else:
+                    return self.async_create_entry(
+                        title=f"Pella Insynctive ({host})",
+                        data={CONF_HOST: host, CONF_PORT: port},
+                        options=probe.suggested_options(),
+                    )
 
         schema = vol.Schema(
             {
@@ -25,7 +36,7 @@ class PellaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 vol.Optional(CONF_PORT, default=DEFAULT_PORT): int,
             }
         )
-        return self.async_show_form(step_id="user", data_schema=schema)
+        return self.async_show_form(step_id="user", data_schema=schema, errors=errors)
 
     @staticmethod
     @callback
@@ -11,6 +11,18 @@ OPT_RECONNECT_MAX_SECONDS = "reconnect_max_seconds"
 OPT_SCAN_ALL_128 = "scan_all_128"
 OPT_POLL_INTERVAL_SECONDS = "poll_interval_seconds"
 OPT_BATTERY_POLL_MINUTES = "battery_poll_minutes"
+OPT_TRACE_PROTOCOL = "trace_protocol"
+OPT_DISCOVERY_EMPTY_RUN = "discovery_empty_run"
+OPT_PROXY_PORT = "proxy_port"
+OPT_PROXY_BIND_HOST = "proxy_bind_host"
+OPT_SEND_RATE_MAX = "send_rate_max"
+OPT_QUERY_TIMEOUT_SECONDS = "query_timeout_seconds"
+OPT_LATENCY_EVENTS = "latency_events"
+OPT_IO_THREAD = "io_thread"
+OPT_TRANSITION_EVENTS = "transition_events"
+# Comma-separated point indices / device kinds; empty means all.
+OPT_TRANSITION_POINTS = "transition_points"
+OPT_TRANSITION_KINDS = "transition_kinds"
 
 DEFAULT_RECONNECT_MIN_SECONDS = 2
 DEFAULT_RECONNECT_MAX_SECONDS = 60
@@ -18,12 +30,101 @@ DEFAULT_RECONNECT_MAX_SECONDS = 60
 DEFAULT_POLL_INTERVAL_SECONDS = 300
 DEFAULT_BATTERY_POLL_MINUTES = 180
 DEFAULT_SCAN_ALL_128 = False
+DEFAULT_TRACE_PROTOCOL = False
+DEFAULT_QUERY_TIMEOUT_SECONDS = 5.0
+DEFAULT_LATENCY_EVENTS = False
+DEFAULT_IO_THREAD = False
+DEFAULT_TRANSITION_EVENTS = True
+# Blind scans stop after this many consecutive empty slots past the last device (0 = scan all).
+DEFAULT_DISCOVERY_EMPTY_RUN = 16
+
+# Local fan-out proxy sharing the bridge session (0 = disabled). It relays
+# commands without authentication, so it only listens on loopback unless a
+# wider bind address (e.g. "0.0.0.0") is set explicitly.
+DEFAULT_PROXY_PORT = 0
+DEFAULT_PROXY_BIND_HOST = "127.0.0.1"
+PROXY_MAX_CLIENTS = 8
+# Unread bytes queued for one proxy client before it is disconnected.
+PROXY_MAX_BUFFER_BYTES = 64 * 1024
+
+# Shade commands issued while disconnected are held (latest per point) and
+# sent on reconnect unless older than OFFLINE_QUEUE_MAX_AGE_SECONDS.
+OFFLINE_QUEUE_SIZE = 32
+OFFLINE_QUEUE_MAX_AGE_SECONDS = 30
+
+# Lines read from the bridge wait here for the dispatcher; when full the
+# oldest line is dropped so the socket reader never stalls.
+RX_QUEUE_SIZE = 256
+
+# After a set command ("!...") is echoed, wait this long for a reply line
+# before the next command, so it can't be taken for a query's reply.
+COMMAND_SETTLE_SECONDS = 0.25
+
+# Status/battery replies (and unsolicited POINTSTATUS lines) are reused for
+# this long before a point is queried again.
+QUERY_CACHE_TTL_SECONDS = 2.0
+
+# Outbound pacing: commands/sec starts at SEND_RATE_START_FRACTION of the
+# configured max (0 = unpaced) and adapts between SEND_RATE_MIN and that max,
+# backing off on garbled replies. Timeouts only count once this many
+# different queries time out with no good reply in between, so one dead
+# point (handled by health tracking) doesn't slow the whole bridge.
+DEFAULT_SEND_RATE_MAX = 10.0
+SEND_RATE_MIN = 1.0
+SEND_RATE_START_FRACTION = 0.5
+SEND_BURST = 3.0
+PACER_TIMEOUT_QUERIES = 3
+
+# Config flow connection probe.
+PROBE_CONNECT_TIMEOUT_SECONDS = 5
+PROBE_QUERY_TIMEOUT_SECONDS = 3.0
+PROBE_STATUS_SAMPLES = 5
+# Upper bound on the whole probe; silent empty slots each cost a query timeout.
+PROBE_MAX_SECONDS = 15
+
+# Discovery waits for the first connection instead of a fixed delay.
+DISCOVERY_CONNECT_TIMEOUT_SECONDS = 30
+DISCOVERY_CONNECT_ATTEMPTS = 10
+
+# Protocol trace capture, written to the HA config dir when enabled.
+TRACE_FILENAME = "pella_insynctive_trace_{entry_id}.log"
+TRACE_MAX_BYTES = 1_000_000
+TRACE_BACKUPS = 2
 
 DEVICE_WINDOW_DOOR = 0x01
 DEVICE_GARAGE = 0x03
 DEVICE_LOCK = 0x0D
 DEVICE_SHADE = 0x13
 
+# Platforms every bridge loads (bridge buttons, per-point sensors); the others
+# are forwarded only once a point of a matching device type shows up.
+BASE_PLATFORMS = ("sensor", "button")
+DEVICE_TYPE_PLATFORMS = {
+    DEVICE_WINDOW_DOOR: "binary_sensor",
+    DEVICE_GARAGE: "binary_sensor",
+    DEVICE_LOCK: "binary_sensor",
+    DEVICE_SHADE: "cover",
+}
+
+# POINTSTATUS values for contact/garage/lock points.
+OPEN_VALUES = {"01", "05"}
+UNLOCK_VALUES = {"02", "06"}
+COVER_OFF_VALUES = {"04", "05", "06"}
+
+# ?POINTDEVICE values the bridge reports for an index with nothing paired.
+EMPTY_DEVICE_TYPES = {0x00, 0xFF}
+
+# Points that fail this many queries in a row drop out of regular sweeps and
+# are re-probed on an exponential backoff (base doubling up to max) until
+# they answer or push an unsolicited update.
+UNRESPONSIVE_AFTER_FAILURES = 3
+HEALTH_BACKOFF_BASE_SECONDS = 300
+HEALTH_BACKOFF_MAX_SECONDS = 6 * 3600
+
+HEALTH_OK = "ok"
+HEALTH_DEGRADED = "degraded"
+HEALTH_UNREACHABLE = "unreachable"
+
 
 # Per-device overrides stored in config entry options.
 # Keys are device_name_001, device_area_001, etc.
@@ -31,3 +132,57 @@ OPT_DEVICE_NAME_PREFIX = "device_name_"
 OPT_DEVICE_AREA_PREFIX = "device_area_"
 
 
+# Bulk refresh
+REFRESH_STATUS = "status"
+REFRESH_BATTERY = "battery"
+REFRESH_BOTH = "both"
+REFRESH_KINDS = (REFRESH_STATUS, REFRESH_BATTERY, REFRESH_BOTH)
+
+EVENT_REFRESH_COMPLETE = f"{DOMAIN}_refresh_complete"
+# One event per confirmed status change of a point.
+EVENT_TRANSITION = f"{DOMAIN}_transition"
+TRANSITION_KIND_CONTACT = "contact"
+TRANSITION_KIND_GARAGE = "garage"
+TRANSITION_KIND_LOCK = "lock"
+TRANSITION_KIND_SHADE = "shade"
+TRANSITION_KIND_UNKNOWN = "unknown"
+TRANSITION_KINDS = {
+    DEVICE_WINDOW_DOOR: TRANSITION_KIND_CONTACT,
+    DEVICE_GARAGE: TRANSITION_KIND_GARAGE,
+    DEVICE_LOCK: TRANSITION_KIND_LOCK,
+    DEVICE_SHADE: TRANSITION_KIND_SHADE,
+}
+# Debug event with per-stage RX-to-entity latency, when latency_events is on.
+EVENT_LATENCY = f"{DOMAIN}_latency"
+
+SERVICE_REFRESH = "refresh"
+ATTR_ENTRY_ID = "entry_id"
+ATTR_POINTS = "points"
+ATTR_KIND = "kind"
+
+SERVICE_QUERY = "query"
+ATTR_COMMANDS = "commands"
+ATTR_TIMEOUT = "timeout"
+
+# On-demand profiling, written to the HA config dir by stop_profile or when
+# the requested duration runs out.
+SERVICE_START_PROFILE = "start_profile"
+SERVICE_STOP_PROFILE = "stop_profile"
+ATTR_DURATION = "duration"
+ATTR_CPROFILE = "cprofile"
+PROFILE_FILENAME = "pella_insynctive_profile_{stamp}.json"
+PROFILE_DEFAULT_SECONDS = 60
+PROFILE_MAX_SECONDS = 600
+PROFILE_MAX_BYTES = 256_000
+PROFILE_TOP_FUNCTIONS = 40
+
+# Domain-wide sweep scheduling across bridges: how many poll/battery sweeps
+# may run at once, and how many bridge queries may be in flight in total.
+SCHEDULER_MAX_SWEEPS = 2
+SCHEDULER_MAX_INFLIGHT_QUERIES = 4
+
+# Data table snapshots (base64 text in service calls and diagnostics).
+SERVICE_EXPORT_SNAPSHOT = "export_snapshot"
+SERVICE_IMPORT_SNAPSHOT = "import_snapshot"
+ATTR_SNAPSHOT = "snapshot"
+ATTR_REPLACE = "replace"
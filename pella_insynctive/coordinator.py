@@ -1,36 +1,109 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
 import re
+import time
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.restore_state import ExtraStoredData, RestoredExtraData
+from homeassistant.helpers.restore_state import async_get as async_get_restore_state
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .client import TelnetClient, TelnetClientConfig
+from .io_thread import DecodedLine, ThreadedTelnetClient
+from .scheduler import async_get_scheduler
+from .snapshot import Snapshot, decode_snapshot, encode_snapshot, snapshot_to_text
+from .metrics import StageTimings
+from .proxy import BridgeProxy
+from .trace import ReplayStats, TraceRecord, TraceReplayClient, async_replay
 from .const import (
     CONF_HOST,
+    COMMAND_SETTLE_SECONDS,
     CONF_PORT,
+    COVER_OFF_VALUES,
     DEVICE_GARAGE,
     DEVICE_LOCK,
     DEVICE_SHADE,
     DEVICE_WINDOW_DOOR,
+    EMPTY_DEVICE_TYPES,
+    DISCOVERY_CONNECT_ATTEMPTS,
+    DISCOVERY_CONNECT_TIMEOUT_SECONDS,
+    HEALTH_BACKOFF_BASE_SECONDS,
+    HEALTH_BACKOFF_MAX_SECONDS,
+    HEALTH_DEGRADED,
+    HEALTH_OK,
+    HEALTH_UNREACHABLE,
     DEFAULT_BATTERY_POLL_MINUTES,
+    DEFAULT_DISCOVERY_EMPTY_RUN,
     DEFAULT_POLL_INTERVAL_SECONDS,
+    BASE_PLATFORMS,
+    DEFAULT_IO_THREAD,
+    DEVICE_TYPE_PLATFORMS,
+    DEFAULT_LATENCY_EVENTS,
+    DEFAULT_PROXY_BIND_HOST,
+    DEFAULT_PROXY_PORT,
+    DEFAULT_QUERY_TIMEOUT_SECONDS,
     DEFAULT_RECONNECT_MAX_SECONDS,
     DEFAULT_RECONNECT_MIN_SECONDS,
     DEFAULT_SCAN_ALL_128,
+    DEFAULT_TRACE_PROTOCOL,
+    DEFAULT_TRANSITION_EVENTS,
+    OFFLINE_QUEUE_MAX_AGE_SECONDS,
+    OPEN_VALUES,
+    OFFLINE_QUEUE_SIZE,
+    RX_QUEUE_SIZE,
+    PACER_TIMEOUT_QUERIES,
+    SEND_BURST,
+    SEND_RATE_MIN,
+    SEND_RATE_START_FRACTION,
+    DEFAULT_SEND_RATE_MAX,
+    OPT_SEND_RATE_MAX,
     OPT_BATTERY_POLL_MINUTES,
+    OPT_DISCOVERY_EMPTY_RUN,
     OPT_POLL_INTERVAL_SECONDS,
+    OPT_DEVICE_AREA_PREFIX,
+    OPT_DEVICE_NAME_PREFIX,
+    OPT_IO_THREAD,
+    OPT_LATENCY_EVENTS,
+    OPT_PROXY_BIND_HOST,
+    OPT_PROXY_PORT,
+    OPT_QUERY_TIMEOUT_SECONDS,
     OPT_RECONNECT_MAX_SECONDS,
     OPT_RECONNECT_MIN_SECONDS,
     OPT_SCAN_ALL_128,
+    OPT_TRACE_PROTOCOL,
+    OPT_TRANSITION_EVENTS,
+    OPT_TRANSITION_KINDS,
+    OPT_TRANSITION_POINTS,
     DOMAIN,
+    EVENT_LATENCY,
+    EVENT_REFRESH_COMPLETE,
+    EVENT_TRANSITION,
+    QUERY_CACHE_TTL_SECONDS,
+    PROXY_MAX_BUFFER_BYTES,
+    PROXY_MAX_CLIENTS,
+    REFRESH_BATTERY,
+    REFRESH_BOTH,
+    REFRESH_STATUS,
+    TRACE_BACKUPS,
+    TRACE_FILENAME,
+    TRACE_MAX_BYTES,
+    TRANSITION_KIND_CONTACT,
+    TRANSITION_KIND_GARAGE,
+    TRANSITION_KIND_LOCK,
+    TRANSITION_KIND_SHADE,
+    TRANSITION_KIND_UNKNOWN,
+    TRANSITION_KINDS,
+    UNLOCK_VALUES,
+    UNRESPONSIVE_AFTER_FAILURES,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -48,9 +121,53 @@ class DeviceInfo:
     name: str
     status_hex: str | None
     battery_hex: str | None
+    # True while values come from restored state and the bridge hasn't confirmed them.
+    stale: bool = False
+
+
+@dataclass(frozen=True)
+class PointIdentity:
+    """Per-point strings entities need on every state write, computed once."""
+
+    base: str  # point_id, or point_XXX before it is known; used in unique_ids
+    label: str  # device name used as entity name prefix
+    device_info: dict
+
+
+@dataclass
+class PointHealth:
+    successes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    next_probe: float | None = None
+
+    @property
+    def state(self) -> str:
+        if self.consecutive_failures >= UNRESPONSIVE_AFTER_FAILURES:
+            return HEALTH_UNREACHABLE
+        if self.consecutive_failures:
+            return HEALTH_DEGRADED
+        return HEALTH_OK
+
+    @property
+    def success_rate(self) -> float | None:
+        total = self.successes + self.failures
+        return round(self.successes / total, 3) if total else None
 
 
 class PellaCoordinator(DataUpdateCoordinator[dict[int, DeviceInfo]]):
+    # Methods start_profile times: RX batch handling, per-line apply, bridge
+    # queries, sweeps (poll/battery ticks and refreshes) and the update fan-out
+    # that writes entity state.
+    PROFILE_TARGETS = (
+        "_publish_batch",
+        "_apply_line",
+        "_query",
+        "_query_point",
+        "_refresh_sweep",
+        "async_set_updated_data",
+    )
+
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry):
         self.hass = hass
         self.entry = entry
@@ -62,29 +179,100 @@ class PellaCoordinator(DataUpdateCoordinator[dict[int, DeviceInfo]]):
         self._poll_s = int(o.get(OPT_POLL_INTERVAL_SECONDS, DEFAULT_POLL_INTERVAL_SECONDS))
         self._battery_poll_min = int(o.get(OPT_BATTERY_POLL_MINUTES, DEFAULT_BATTERY_POLL_MINUTES))
         self._scan_all_128 = bool(o.get(OPT_SCAN_ALL_128, DEFAULT_SCAN_ALL_128))
+        self._query_timeout = float(o.get(OPT_QUERY_TIMEOUT_SECONDS, DEFAULT_QUERY_TIMEOUT_SECONDS))
+        self._proxy_port = int(o.get(OPT_PROXY_PORT, DEFAULT_PROXY_PORT))
+        self._proxy_bind_host = str(o.get(OPT_PROXY_BIND_HOST) or DEFAULT_PROXY_BIND_HOST)
+        self._discovery_empty_run = int(o.get(OPT_DISCOVERY_EMPTY_RUN, DEFAULT_DISCOVERY_EMPTY_RUN))
         self._shade_invert = True  # permanently invert shade positions
-        self._client = TelnetClient(
-            TelnetClientConfig(
-                host=self._host,
-                port=self._port,
-                reconnect_min_seconds=int(o.get(OPT_RECONNECT_MIN_SECONDS, DEFAULT_RECONNECT_MIN_SECONDS)),
-                reconnect_max_seconds=int(o.get(OPT_RECONNECT_MAX_SECONDS, DEFAULT_RECONNECT_MAX_SECONDS)),
-            ),
-            on_line=self._handle_line,
+        trace_path = None
+        if bool(o.get(OPT_TRACE_PROTOCOL, DEFAULT_TRACE_PROTOCOL)):
+            trace_path = hass.config.path(TRACE_FILENAME.format(entry_id=entry.entry_id))
+        client_cfg = TelnetClientConfig(
+            host=self._host,
+            port=self._port,
+            reconnect_min_seconds=int(o.get(OPT_RECONNECT_MIN_SECONDS, DEFAULT_RECONNECT_MIN_SECONDS)),
+            reconnect_max_seconds=int(o.get(OPT_RECONNECT_MAX_SECONDS, DEFAULT_RECONNECT_MAX_SECONDS)),
+            trace_path=trace_path,
+            trace_max_bytes=TRACE_MAX_BYTES,
+            trace_backups=TRACE_BACKUPS,
+            offline_queue_size=OFFLINE_QUEUE_SIZE,
+            offline_queue_max_age=OFFLINE_QUEUE_MAX_AGE_SECONDS,
+            rx_queue_size=RX_QUEUE_SIZE,
+            send_rate_max=float(o.get(OPT_SEND_RATE_MAX, DEFAULT_SEND_RATE_MAX)),
+            send_rate_min=SEND_RATE_MIN,
+            send_rate_start_fraction=SEND_RATE_START_FRACTION,
+            send_burst=SEND_BURST,
         )
+        self._scheduler = async_get_scheduler(hass)
+        self._client: TelnetClient | ThreadedTelnetClient
+        if bool(o.get(OPT_IO_THREAD, DEFAULT_IO_THREAD)):
+            self._client = ThreadedTelnetClient(client_cfg, self._decode_line, self._handle_decoded, hass.loop)
+        else:
+            self._client = TelnetClient(client_cfg, on_lines=self._handle_lines)
 
         self._cmd_lock = asyncio.Lock()
         self._pending: asyncio.Future[str] | None = None
         self._last_cmd: str | None = None
+        # Resolved by the echo of the set command in flight; see _command().
+        self._echo: asyncio.Future[None] | None = None
+        # Queries that timed out since the last good reply; see _note_query_timeout().
+        self._timeout_streak: set[str] = set()
+        self._sweep_lock = asyncio.Lock()
+
+        # Per-point query outcomes; chronically failing points are demoted to
+        # a backoff probe schedule.
+        self._health: dict[int, PointHealth] = {}
+        self._identities: dict[int, PointIdentity] = {}
+
+        # RX-to-entity latency, per stage.
+        self.latency = StageTimings("read_to_dispatch", "parse", "coordinator_update", "entity_write", "total")
+        self._latency_events = bool(o.get(OPT_LATENCY_EVENTS, DEFAULT_LATENCY_EVENTS))
+        self._tracking_writes = False
+        self._entity_write_s = 0.0
+
+        # Read-through cache and single-flight map for _query_point, keyed by
+        # command. Cache values are (reply, monotonic time).
+        self._query_cache: dict[str, tuple[str, float]] = {}
+        self._inflight: dict[str, asyncio.Future[str]] = {}
+        self.query_stats: dict[str, int] = {"hits": 0, "misses": 0, "merged": 0}
 
         self._poll_unsub = None
         self._battery_unsub = None
+        self._proxy: BridgeProxy | None = None
+
+        # Platforms subscribe here to add entities as each point resolves.
+        self._transition_events = False
+        self._transition_points: frozenset[int] = frozenset()
+        self._transition_kinds: frozenset[str] = frozenset()
+        self._load_transition_filters()
+        # Point index -> HA device id, and the overrides last pushed to the registry.
+        self._registry_index: dict[int, str] = {}
+        self._overrides = self._override_map()
+        self._registry_unsub: Callable[[], None] | None = None
+        self._discovery_task: asyncio.Task | None = None
+        # (point index, entity key) of entities handed to the platforms; see async_claim_entity().
+        self._entity_keys: set[tuple[int, str]] = set()
+        # Registered point_XXX unique_ids, loaded on first use; see entity_unique_id().
+        self._index_uids: set[str] | None = None
+        # Platforms forwarded for this entry so far; see required_platforms().
+        self.loaded_platforms: set[str] = set()
+        # Late forwards still setting up, by platform; they join loaded_platforms when done.
+        self.pending_platforms: dict[str, asyncio.Task] = {}
+        self._point_listeners: list[Callable[[int], None]] = []
+        self._started_at: float | None = None
+        # True between async_start() and async_stop(); trace replay refuses to run then.
+        self._running = False
+        self.startup_timings: dict[str, float | None] = {
+            "connected_s": None,
+            "first_entity_s": None,
+            "all_entities_s": None,
+        }
 
         super().__init__(hass, _LOGGER, name="pella_insynctive", update_interval=None)
         self.data: dict[int, DeviceInfo] = {}
 
     @property
-    def client(self) -> TelnetClient:
+    def client(self) -> TelnetClient | ThreadedTelnetClient:
         return self._client
 
     @property
@@ -95,20 +283,76 @@ class PellaCoordinator(DataUpdateCoordinator[dict[int, DeviceInfo]]):
     def bridge_name(self) -> str:
         return f"Pella Insynctive ({self._host})"
 
+    def point_identity(self, idx: int) -> PointIdentity:
+        """Cached identity for a point; rebuilt only after _invalidate_identity."""
+        ident = self._identities.get(idx)
+        if ident is None:
+            dev = self.data.get(idx)
+            ident = PointIdentity(
+                base=dev.point_id if dev and dev.point_id else f"point_{idx:03d}",
+                label=dev.name if dev else f"Point {idx:03d}",
+                device_info=self._build_point_device_info(idx, dev),
+            )
+            self._identities[idx] = ident
+        return ident
+
+    def entity_unique_id(self, key: str, idx: int) -> str:
+        """unique_id for a new entity `key` of point idx.
+
+        Based on the point id once it is known, except for entities already
+        registered as point_XXX (created before discovery resolved the point):
+        they keep that id, so a reload doesn't register them a second time.
+        """
+        by_index = f"{self.entry.entry_id}_{key}_point_{idx:03d}"
+        if self._index_uids is None:
+            self._index_uids = {
+                ent.unique_id
+                for ent in er.async_entries_for_config_entry(er.async_get(self.hass), self.entry.entry_id)
+                if "_point_" in ent.unique_id
+            }
+        if by_index in self._index_uids:
+            return by_index
+        return f"{self.entry.entry_id}_{key}_{self.point_identity(idx).base}"
+
+    @callback
+    def _invalidate_identity(self, idx: int | None = None) -> None:
+        """Drop cached identity for one point (or all, e.g. after options change)."""
+        if idx is None:
+            self._identities.clear()
+        else:
+            self._identities.pop(idx, None)
+
+    @callback
+    def async_options_updated(self) -> None:
+        """Name/area overrides may have changed; rebuild identities and sync the registry.
+
+        Only points whose overrides actually changed are pushed to the registry.
+        """
+        self._invalidate_identity()
+        self._load_transition_filters()
+        overrides = self._override_map()
+        changed = {
+            idx
+            for idx in overrides.keys() | self._overrides.keys()
+            if overrides.get(idx) != self._overrides.get(idx)
+        }
+        self._overrides = overrides
+        if changed:
+            self._async_sync_registry(sorted(changed))
+        self.async_update_listeners()
+
     def point_device_info(self, idx: int) -> dict:
-        dev = self.data.get(idx)
-        # IMPORTANT: use the bridge point index as the stable identifier
-        point_key = f"point_{idx:03d}"
+        return self.point_identity(idx).device_info
 
+    def _build_point_device_info(self, idx: int, dev: DeviceInfo | None) -> dict:
         return {
-            "identifiers": {(DOMAIN, f"{self.bridge_id}_{point_key}")},
+            "identifiers": {self._point_device_identifier(idx)},
             "name": self._device_name_override(dev, idx),
             "manufacturer": "Pella",
             "model": self._device_model(dev),
             "via_device": (DOMAIN, self.bridge_id),
         }
 
-
     def _device_name_override(self, dev: DeviceInfo | None, idx: int) -> str:
         key = f"device_name_{idx:03d}"
         v = self.entry.options.get(key)
@@ -123,17 +367,45 @@ class PellaCoordinator(DataUpdateCoordinator[dict[int, DeviceInfo]]):
             return str(v)
         return None
 
-    def _apply_device_overrides_to_registry(self) -> None:
+    def _point_device_identifier(self, idx: int) -> tuple[str, str]:
+        # IMPORTANT: use the bridge point index as the stable identifier
+        return (DOMAIN, f"{self.bridge_id}_point_{idx:03d}")
+
+    def _override_map(self) -> dict[int, tuple[str | None, str | None]]:
+        """(name, area) override per overridden point, from the entry options."""
+        indices: set[int] = set()
+        for key, value in self.entry.options.items():
+            for prefix in (OPT_DEVICE_NAME_PREFIX, OPT_DEVICE_AREA_PREFIX):
+                suffix = key[len(prefix) :]
+                if value and key.startswith(prefix) and suffix.isdigit():
+                    indices.add(int(suffix))
+        return {
+            idx: (self.entry.options.get(f"{OPT_DEVICE_NAME_PREFIX}{idx:03d}") or None, self._device_area_override(idx))
+            for idx in indices
+        }
+
+    @callback
+    def _async_sync_registry(self, indices) -> int:
+        """Push name/area overrides for these points to the device registry.
+
+        Device ids are cached per point index, and only fields that differ
+        from the registry are written. Returns the number of devices updated.
+        """
         dev_reg = dr.async_get(self.hass)
-        for idx, dev in self.data.items():
-            point_key = dev.point_id if dev.point_id else f"point_{idx:03d}"
-            identifiers = {(DOMAIN, f"{self.bridge_id}_{point_key}")}
-            ha_dev = dev_reg.async_get_device(identifiers=identifiers)
-            if not ha_dev:
-                continue
+        updated = 0
+        for idx in indices:
+            device_id = self._registry_index.get(idx)
+            ha_dev = dev_reg.async_get(device_id) if device_id else None
+            if ha_dev is None:
+                ha_dev = dev_reg.async_get_device(identifiers={self._point_device_identifier(idx)})
+                if ha_dev is None:
+                    # Not created yet; _async_device_registry_updated syncs it on create.
+                    self._registry_index.pop(idx, None)
+                    continue
+                self._registry_index[idx] = ha_dev.id
 
             updates = {}
-            new_name = self._device_name_override(dev, idx)
+            new_name = self._device_name_override(self.data.get(idx), idx)
             if new_name and ha_dev.name != new_name:
                 updates["name"] = new_name
 
@@ -143,7 +415,33 @@ class PellaCoordinator(DataUpdateCoordinator[dict[int, DeviceInfo]]):
 
             if updates:
                 dev_reg.async_update_device(ha_dev.id, **updates)
-
+                updated += 1
+        return updated
+
+    @callback
+    def _async_device_registry_updated(self, event) -> None:
+        action = event.data.get("action")
+        device_id = event.data.get("device_id")
+        if action == "remove":
+            for idx, known in list(self._registry_index.items()):
+                if known == device_id:
+                    del self._registry_index[idx]
+            return
+        if action != "create":
+            return
+        ha_dev = dr.async_get(self.hass).async_get(device_id)
+        if ha_dev is None:
+            return
+        prefix = f"{self.bridge_id}_point_"
+        for domain, ident in ha_dev.identifiers:
+            if domain == DOMAIN and ident.startswith(prefix):
+                try:
+                    idx = int(ident[len(prefix) :])
+                except ValueError:
+                    return
+                self._registry_index[idx] = ha_dev.id
+                self._async_sync_registry((idx,))
+                return
 
     def _device_model(self, dev: DeviceInfo | None) -> str:
         # Prefer deriving model from the first two digits of POINTID (serial),
@@ -172,6 +470,128 @@ class PellaCoordinator(DataUpdateCoordinator[dict[int, DeviceInfo]]):
         return "Insynctive Device"
 
 
+    def point_restore_data(self, idx: int) -> ExtraStoredData | None:
+        """Extra data entities persist so the point can be seeded on next start."""
+        dev = self.data.get(idx)
+        if dev is None:
+            return None
+        return RestoredExtraData(
+            {
+                "index": dev.index,
+                "point_id": dev.point_id,
+                "device_type": dev.device_type,
+                "name": dev.name,
+                "status_hex": dev.status_hex,
+                "battery_hex": dev.battery_hex,
+            }
+        )
+
+    @callback
+    def async_seed_point(self, restored: dict) -> bool:
+        """Create a stale DeviceInfo from restored entity data if the point is unknown."""
+        try:
+            idx = int(restored["index"])
+        except (KeyError, TypeError, ValueError):
+            return False
+        if idx in self.data or not 1 <= idx <= 128:
+            return False
+        self.data[idx] = DeviceInfo(
+            idx,
+            restored.get("point_id"),
+            restored.get("device_type"),
+            restored.get("name") or f"Pella Device ({idx:03d})",
+            restored.get("status_hex"),
+            restored.get("battery_hex"),
+            stale=True,
+        )
+        self._invalidate_identity(idx)
+        return True
+
+    @callback
+    def async_seed_from_restore_state(self) -> int:
+        """Seed points from the last state our entities saved before shutdown.
+
+        Runs before the platforms are set up so entities exist (with their
+        last-known values) right away instead of after discovery reaches them.
+        """
+        ent_reg = er.async_get(self.hass)
+        last_states = async_get_restore_state(self.hass).last_states
+        seeded = 0
+        for ent in er.async_entries_for_config_entry(ent_reg, self.entry.entry_id):
+            stored = last_states.get(ent.entity_id)
+            if stored is None or stored.extra_data is None:
+                continue
+            if self.async_seed_point(stored.extra_data.as_dict()):
+                seeded += 1
+        if seeded:
+            _LOGGER.debug("Seeded %s points from restored state", seeded)
+        return seeded
+
+    def export_snapshot(self) -> bytes:
+        """Compact, versioned dump of the data table and device overrides."""
+        points = [
+            {
+                "index": dev.index,
+                "point_id": dev.point_id,
+                "device_type": dev.device_type,
+                "name": dev.name,
+                "status_hex": dev.status_hex,
+                "battery_hex": dev.battery_hex,
+            }
+            for _, dev in sorted(self.data.items())
+        ]
+        overrides: dict[str, dict[int, str]] = {"name": {}, "area": {}}
+        for kind, prefix in (("name", OPT_DEVICE_NAME_PREFIX), ("area", OPT_DEVICE_AREA_PREFIX)):
+            for key, value in self.entry.options.items():
+                if key.startswith(prefix) and value:
+                    overrides[kind][int(key[len(prefix) :])] = str(value)
+        return encode_snapshot(Snapshot(self.bridge_id, points, overrides))
+
+    @callback
+    def async_import_snapshot(self, data: bytes, replace: bool = False) -> int:
+        """Seed points (and unset overrides) from an exported snapshot.
+
+        Imported points are stale until the bridge confirms them. Known points
+        are kept unless replace is set. Raises ValueError on a bad snapshot.
+        Returns the number of points written.
+        """
+        snap = decode_snapshot(data)
+        added: list[int] = []
+        written = 0
+        for point in snap.points:
+            idx = point["index"]
+            if not isinstance(idx, int) or not 1 <= idx <= 128:
+                continue
+            if idx in self.data and not replace:
+                continue
+            if idx not in self.data:
+                added.append(idx)
+            self.data[idx] = DeviceInfo(
+                idx,
+                point["point_id"],
+                point["device_type"],
+                point["name"] or f"Pella Device ({idx:03d})",
+                point["status_hex"],
+                point["battery_hex"],
+                stale=True,
+            )
+            self._invalidate_identity(idx)
+            written += 1
+
+        options = dict(self.entry.options)
+        for kind, prefix in (("name", OPT_DEVICE_NAME_PREFIX), ("area", OPT_DEVICE_AREA_PREFIX)):
+            for idx, value in snap.overrides.get(kind, {}).items():
+                options.setdefault(f"{prefix}{idx:03d}", value)
+        if options != self.entry.options:
+            self.hass.config_entries.async_update_entry(self.entry, options=options)
+
+        for idx in added:
+            self._async_point_resolved(idx)
+        if written:
+            self.async_set_updated_data(self.data)
+        _LOGGER.debug("Imported %s points from snapshot of bridge %s", written, snap.bridge_id)
+        return written
+
     @property
     def shade_invert(self) -> bool:
         return self._shade_invert
@@ -199,63 +619,185 @@ class PellaCoordinator(DataUpdateCoordinator[dict[int, DeviceInfo]]):
         await self.pointset(idx, self.position_to_shade_value(position))
         await asyncio.sleep(0.4)
         try:
-            resp = await self._query(f"?POINTSTATUS-{idx:03d}", timeout=5.0)
+            resp = await self._query_point(idx, f"?POINTSTATUS-{idx:03d}")
             v = self._parse_status_hex(resp)
             if v is not None and idx in self.data:
-                self.data[idx].status_hex = v
+                self._set_status(idx, v)
                 self.async_set_updated_data(self.data)
         except Exception:
             pass
 
+    def platform_for_point(self, idx: int) -> str | None:
+        dev = self.data.get(idx)
+        return DEVICE_TYPE_PLATFORMS.get(dev.device_type) if dev else None
+
+    def required_platforms(self) -> set[str]:
+        """Platforms needed for the points known right now."""
+        platforms = set(BASE_PLATFORMS)
+        for idx in self.data:
+            if (platform := self.platform_for_point(idx)) is not None:
+                platforms.add(platform)
+        return platforms
+
+    @callback
+    def async_add_point_listener(self, cb: Callable[[int], None]) -> Callable[[], None]:
+        """Call cb(idx) whenever a point is discovered or first seen.
+
+        Returns a callable that removes the listener.
+        """
+        self._point_listeners.append(cb)
+
+        @callback
+        def _remove() -> None:
+            if cb in self._point_listeners:
+                self._point_listeners.remove(cb)
+
+        return _remove
+
+    @callback
+    def _async_point_resolved(self, idx: int) -> None:
+        for cb in list(self._point_listeners):
+            cb(idx)
+
+    @callback
+    def async_claim_entity(self, idx: int, key: str) -> bool:
+        """Claim entity `key` of point idx; False if it was already created.
+
+        Platforms ask on every discovery/push. Keyed by point index rather
+        than unique_id, which depends on whether the point id was known when
+        the entity was created. The set lives and dies with the coordinator,
+        so a reload starts clean.
+        """
+        if (idx, key) in self._entity_keys:
+            return False
+        self._entity_keys.add((idx, key))
+        return True
+
+    @callback
+    def async_note_entities_added(self, count: int) -> None:
+        """Record time-to-first-entity; platforms call this after adding entities."""
+        if count and self._started_at is not None and self.startup_timings["first_entity_s"] is None:
+            self.startup_timings["first_entity_s"] = round(time.monotonic() - self._started_at, 3)
+
     async def async_start(self) -> None:
+        self._running = True
+        self._started_at = time.monotonic()
+        self._scheduler.register(self.entry.entry_id)
+        self._registry_unsub = self.hass.bus.async_listen(
+            dr.EVENT_DEVICE_REGISTRY_UPDATED, self._async_device_registry_updated
+        )
         await self._client.start()
-        self.hass.async_create_task(self._startup_discovery())
-
+        self._discovery_task = self.hass.async_create_task(self._startup_discovery())
+
+        if self._proxy_port > 0:
+            proxy = BridgeProxy(
+                self._proxy_bind_host,
+                self._proxy_port,
+                query=self._proxy_query,
+                send=self._proxy_send,
+                max_clients=PROXY_MAX_CLIENTS,
+                max_buffer=PROXY_MAX_BUFFER_BYTES,
+            )
+            try:
+                await proxy.start()
+                self._proxy = proxy
+            except OSError as err:
+                _LOGGER.error(
+                    "Could not start bridge proxy on %s:%s: %s", self._proxy_bind_host, self._proxy_port, err
+                )
+
+        # Timers are phase-shifted per bridge by the domain scheduler.
+        entry_id = self.entry.entry_id
         if self._poll_s > 0:
-            self._poll_unsub = async_track_time_interval(self.hass, self._poll_tick, timedelta(seconds=self._poll_s))
+            self._poll_unsub = self._scheduler.async_track_interval(
+                entry_id, self._poll_tick, timedelta(seconds=self._poll_s)
+            )
         if self._battery_poll_min > 0:
-            self._battery_unsub = async_track_time_interval(
-                self.hass, self._battery_tick, timedelta(minutes=self._battery_poll_min)
+            self._battery_unsub = self._scheduler.async_track_interval(
+                entry_id, self._battery_tick, timedelta(minutes=self._battery_poll_min)
             )
 
     async def async_stop(self) -> None:
+        if self._discovery_task and not self._discovery_task.done():
+            self._discovery_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._discovery_task
+        self._discovery_task = None
+        if self._registry_unsub:
+            self._registry_unsub()
+            self._registry_unsub = None
         if self._poll_unsub:
             self._poll_unsub()
             self._poll_unsub = None
         if self._battery_unsub:
             self._battery_unsub()
             self._battery_unsub = None
+        if self._proxy:
+            await self._proxy.stop()
+            self._proxy = None
         await self._client.stop()
+        # Fail a query still waiting on the closed session instead of letting it time out.
+        if self._pending and not self._pending.done():
+            self._pending.set_exception(ConnectionError("Coordinator stopped"))
+        self._scheduler.unregister(self.entry.entry_id)
+        self._running = False
+
+    async def _proxy_query(self, cmd: str) -> str:
+        return await self._query(cmd)
+
+    async def _proxy_send(self, cmd: str) -> str | None:
+        return await self._command(cmd)
 
     async def _startup_discovery(self) -> None:
-        await asyncio.sleep(2)
-        if not self._client.is_connected:
+        for attempt in range(1, DISCOVERY_CONNECT_ATTEMPTS + 1):
+            if await self._client.wait_connected(DISCOVERY_CONNECT_TIMEOUT_SECONDS):
+                break
+            _LOGGER.warning(
+                "Bridge %s:%s not connected after %ss (attempt %s/%s)",
+                self._host, self._port, DISCOVERY_CONNECT_TIMEOUT_SECONDS, attempt, DISCOVERY_CONNECT_ATTEMPTS,
+            )
+        else:
+            _LOGGER.error("Bridge %s:%s never connected; skipping discovery until reload", self._host, self._port)
             return
+        if self._started_at is not None:
+            self.startup_timings["connected_s"] = round(time.monotonic() - self._started_at, 3)
 
         count = 0
         try:
-            count_str = await self._query("?POINTCOUNT", timeout=5.0)
+            count_str = await self._query("?POINTCOUNT")
             digits = "".join(ch for ch in count_str if ch.isdigit())
             count = int(digits) if digits else 0
         except TimeoutError:
             _LOGGER.warning("Timeout on ?POINTCOUNT; falling back to scan")
 
         # If POINTCOUNT is 2, we should at least try points 001..002.
-        indices = range(1, 129) if (self._scan_all_128 or count == 0) else range(1, min(128, count) + 1)
+        sparse_scan = self._scan_all_128 or count == 0
+        indices = range(1, 129) if sparse_scan else range(1, min(128, count) + 1)
         _LOGGER.debug("Discovery scanning %s points (POINTCOUNT=%s, scan_all_128=%s)", len(list(indices)), count, self._scan_all_128)
 
+        # On a blind scan, stop after a run of empty/unresponsive slots past the
+        # last populated one instead of walking all 128 indices.
+        empty_run = 0
+        found_any = False
         for i in indices:
+            if sparse_scan and found_any and self._discovery_empty_run and empty_run >= self._discovery_empty_run:
+                _LOGGER.debug("Discovery stopping at point %03d after %s empty slots", i, empty_run)
+                break
+
             idx = f"{i:03d}"
             try:
-                dtype_raw = await self._query(f"?POINTDEVICE-{idx}", timeout=5.0)
-                pid_raw = await self._query(f"?POINTID-{idx}", timeout=5.0)
-                status_raw = await self._query(f"?POINTSTATUS-{idx}", timeout=5.0)
+                dtype_raw = await self._query(f"?POINTDEVICE-{idx}")
+                if self._is_empty_point_reply(dtype_raw):
+                    _LOGGER.debug("No device at point %s (%s)", idx, dtype_raw)
+                    empty_run += 1
+                    continue
+
+                pid_raw = await self._query(f"?POINTID-{idx}")
+                status_raw = await self._query(f"?POINTSTATUS-{idx}")
 
-                # Battery is not included in POINTSTATUS; fetch once during discovery so the sensor
-                # doesn't sit at Unknown for hours until the first battery poll interval.
                 battery_raw = None
                 try:
-                    battery_raw = await self._query(f"?POINTBATTERYGET-{idx}", timeout=5.0)
+                    battery_raw = await self._query(f"?POINTBATTERYGET-{idx}")
                 except TimeoutError:
                     _LOGGER.debug("Timeout querying battery for point %s during discovery", idx)
 
@@ -263,97 +805,319 @@ class PellaCoordinator(DataUpdateCoordinator[dict[int, DeviceInfo]]):
                 point_id = self._parse_point_id(pid_raw)
                 status_hex = self._parse_status_hex(status_raw)
 
-                battery_hex = None
-                if battery_raw:
-                    m = RE_HEX_DOLLAR.search(battery_raw)
-                    if m:
-                        battery_hex = f"${m.group(1).upper()}"
+                battery_hex = self._parse_battery_hex(battery_raw) if battery_raw else None
 
                 # If we can't parse a device type, still create the device so HA shows it,
                 # and logs will tell us what came back.
                 name = self._default_name(device_type, i, point_id)
 
                 self.data[i] = DeviceInfo(i, point_id, device_type, name, status_hex, battery_hex)
+                self._invalidate_identity(i)
+                self._async_point_resolved(i)
                 _LOGGER.debug("Discovered point %s: type_raw=%s type=%s id_raw=%s id=%s status_raw=%s status=%s",
                               idx, dtype_raw, device_type, pid_raw, point_id, status_raw, status_hex)
             except TimeoutError:
                 _LOGGER.debug("Timeout querying point %s; skipping", idx)
+                empty_run += 1
                 continue
             except Exception as err:
                 _LOGGER.debug("Error querying point %s; skipping: %s", idx, err)
+                empty_run += 1
                 continue
+            empty_run = 0
+            found_any = True
 
         self.async_set_updated_data(self.data)
-        self._apply_device_overrides_to_registry()
+        # Devices created during discovery were synced as they appeared; this
+        # catches overridden points whose devices already existed.
+        self._async_sync_registry(sorted(self._overrides))
+        if self._started_at is not None:
+            self.startup_timings["all_entities_s"] = round(time.monotonic() - self._started_at, 3)
+        _LOGGER.info("Discovery finished with %s points: %s", len(self.data), self.startup_timings)
 
     async def _poll_tick(self, _now) -> None:
         if not self._client.is_connected or not self.data:
             return
-        for i, dev in list(self.data.items()):
-            idx = f"{i:03d}"
-            try:
-                resp = await self._query(f"?POINTSTATUS-{idx}", timeout=5.0)
-                v = self._parse_status_hex(resp)
-                if v is not None:
-                    dev.status_hex = v
-            except TimeoutError:
-                _LOGGER.debug("Timeout polling status for point %s", idx)
-        self.async_set_updated_data(self.data)
+        await self._refresh_sweep(list(self.data), REFRESH_STATUS)
+        await self._scheduler.async_publish(self.entry.entry_id, self._publish_data)
 
     async def _battery_tick(self, _now) -> None:
         if not self._client.is_connected or not self.data:
             return
-        for i, dev in list(self.data.items()):
-            idx = f"{i:03d}"
-            try:
-                resp = await self._query(f"?POINTBATTERYGET-{idx}", timeout=5.0)
-                # Battery responses tend to be $xx but may come as POINTBATTERYGET-XXX,$xx
-                m = RE_HEX_DOLLAR.search(resp)
-                if m:
-                    dev.battery_hex = f"${m.group(1).upper()}"
-                else:
-                    tail = self._after_comma(resp).strip()
-                    if tail.startswith("$") and len(tail) == 3:
-                        tail = tail[1:]
-                    if len(tail) == 2 and all(c in "0123456789abcdefABCDEF" for c in tail):
-                        dev.battery_hex = f"${tail.upper()}"
-            except TimeoutError:
-                _LOGGER.debug("Timeout polling battery for point %s", idx)
+        await self._refresh_sweep(list(self.data), REFRESH_BATTERY)
+        await self._scheduler.async_publish(self.entry.entry_id, self._publish_data)
+
+    async def async_refresh(self, indices: list[int] | None = None, kind: str = REFRESH_BOTH) -> dict:
+        """Refresh many points in one paced sweep.
+
+        Publishes a single coordinator update at the end and fires
+        EVENT_REFRESH_COMPLETE with the sweep's duration and failure counts.
+        """
+        if indices is None:
+            indices = sorted(self.data)
+        else:
+            indices = sorted({i for i in indices if i in self.data})
+
+        started = time.monotonic()
+        ok, failed = await self._refresh_sweep(indices, kind)
+        duration = round(time.monotonic() - started, 3)
+        await self._scheduler.async_publish(self.entry.entry_id, self._publish_data)
+
+        result = {
+            "entry_id": self.entry.entry_id,
+            "kind": kind,
+            "points": len(indices),
+            "succeeded": ok,
+            "failed": failed,
+            "duration_s": duration,
+        }
+        self.hass.bus.async_fire(EVENT_REFRESH_COMPLETE, result)
+        _LOGGER.debug("Refresh sweep finished: %s", result)
+        return result
+
+    @callback
+    def _publish_data(self) -> None:
         self.async_set_updated_data(self.data)
 
+    async def _refresh_sweep(self, indices: list[int], kind: str) -> tuple[int, int]:
+        """Query status and/or battery for each point without publishing updates.
+
+        Sweeps are serialized so a button press and a timed poll don't
+        interleave their queries on the bridge, and take one of the domain
+        scheduler's sweep slots so bridges take turns; the transport's token
+        bucket does the pacing. Returns (succeeded, failed)
+        counted per query.
+        """
+        cmds: list[tuple[str, str]] = []
+        if kind in (REFRESH_STATUS, REFRESH_BOTH):
+            cmds.append(("status", "?POINTSTATUS"))
+        if kind in (REFRESH_BATTERY, REFRESH_BOTH):
+            cmds.append(("battery", "?POINTBATTERYGET"))
+
+        ok = failed = 0
+        async with self._sweep_lock, self._scheduler.sweep(self.entry.entry_id):
+            for i in indices:
+                dev = self.data.get(i)
+                if dev is None:
+                    continue
+                idx = f"{i:03d}"
+                if not self._probe_due(i):
+                    continue
+                for field, prefix in cmds:
+                    if not self._client.is_connected:
+                        failed += 1
+                        continue
+                    try:
+                        resp = await self._query_point(i, f"{prefix}-{idx}")
+                    except TimeoutError:
+                        _LOGGER.debug("Timeout polling %s for point %s", field, idx)
+                        failed += 1
+                        break
+                    except ConnectionError:
+                        failed += 1
+                        continue
+                    if field == "status":
+                        v = self._parse_status_hex(resp)
+                        if v is not None:
+                            self._set_status(i, v)
+                    else:
+                        v = self._parse_battery_hex(resp)
+                        if v is not None:
+                            dev.battery_hex = v
+                    if v is None:
+                        # Garbled or mismatched reply: usually a sign we're going too fast.
+                        self._client.note_reply_error()
+                    ok += 1
+        return ok, failed
+
+    def _load_transition_filters(self) -> None:
+        o = self.entry.options
+        self._transition_events = bool(o.get(OPT_TRANSITION_EVENTS, DEFAULT_TRANSITION_EVENTS))
+        points = str(o.get(OPT_TRANSITION_POINTS) or "")
+        kinds = str(o.get(OPT_TRANSITION_KINDS) or "")
+        self._transition_points = frozenset(int(p) for p in points.replace(" ", "").split(",") if p.isdigit())
+        self._transition_kinds = frozenset(k.strip().lower() for k in kinds.split(",") if k.strip())
+
+    @callback
+    def _set_status(self, idx: int, value: str, rx_time: float | None = None) -> None:
+        """Store a bridge-confirmed status and fire EVENT_TRANSITION if it changed.
+
+        Only changes from a confirmed value count; a point's first status or
+        one replacing a restored (stale) value is not a transition.
+        """
+        dev = self.data[idx]
+        old, was_stale = dev.status_hex, dev.stale
+        dev.status_hex = value
+        dev.stale = False
+        if not self._transition_events or old is None or was_stale or old.upper() == value.upper():
+            return
+        if self._transition_points and idx not in self._transition_points:
+            return
+        kind = TRANSITION_KINDS.get(dev.device_type, TRANSITION_KIND_UNKNOWN)
+        if self._transition_kinds and kind not in self._transition_kinds:
+            return
+        rx_ts = time.time()
+        if rx_time is not None:
+            rx_ts -= time.monotonic() - rx_time
+        self.hass.bus.async_fire(
+            EVENT_TRANSITION,
+            {
+                "entry_id": self.entry.entry_id,
+                "point": idx,
+                "kind": kind,
+                "old": self._decode_status(kind, old),
+                "new": self._decode_status(kind, value),
+                # Wall-clock time the reply or push was read from the socket.
+                "rx_ts": round(rx_ts, 3),
+            },
+        )
+
+    def _decode_status(self, kind: str, value: str) -> dict:
+        value = value.upper()
+        if kind in (TRANSITION_KIND_CONTACT, TRANSITION_KIND_GARAGE):
+            return {"open": value in OPEN_VALUES, "cover_off": value in COVER_OFF_VALUES}
+        if kind == TRANSITION_KIND_LOCK:
+            return {"locked": value not in UNLOCK_VALUES, "cover_off": value in COVER_OFF_VALUES}
+        if kind == TRANSITION_KIND_SHADE:
+            return {"position": self.shade_value_to_position(value)}
+        return {"raw": value}
+
+    def point_health(self, idx: int) -> dict:
+        h = self._health.get(idx) or PointHealth()
+        next_probe_in = None
+        if h.next_probe is not None:
+            next_probe_in = max(0, round(h.next_probe - time.monotonic()))
+        return {
+            "health": h.state,
+            "consecutive_failures": h.consecutive_failures,
+            "success_rate": h.success_rate,
+            "next_probe_in_s": next_probe_in,
+        }
+
+    def _probe_due(self, idx: int) -> bool:
+        """Return False while a demoted point is waiting out its backoff."""
+        h = self._health.get(idx)
+        return h is None or h.next_probe is None or time.monotonic() >= h.next_probe
+
+    def _note_point_failure(self, idx: int) -> None:
+        h = self._health.setdefault(idx, PointHealth())
+        h.failures += 1
+        h.consecutive_failures += 1
+        if h.consecutive_failures >= UNRESPONSIVE_AFTER_FAILURES:
+            exp = h.consecutive_failures - UNRESPONSIVE_AFTER_FAILURES
+            delay = min(HEALTH_BACKOFF_BASE_SECONDS * (2 ** min(exp, 16)), HEALTH_BACKOFF_MAX_SECONDS)
+            if h.next_probe is None:
+                _LOGGER.debug("Point %03d unreachable after %s failures; backing off", idx, h.consecutive_failures)
+            h.next_probe = time.monotonic() + delay
+
+    def _note_point_success(self, idx: int) -> None:
+        h = self._health.setdefault(idx, PointHealth())
+        h.successes += 1
+        if h.next_probe is not None:
+            _LOGGER.debug("Point %03d is responding again", idx)
+        h.consecutive_failures = 0
+        h.next_probe = None
 
     async def async_refresh_point_status(self, idx: int) -> None:
         """Refresh a single point's status from the bridge."""
-        resp = await self._query(f"?POINTSTATUS-{idx:03d}", timeout=5.0)
+        resp = await self._query_point(idx, f"?POINTSTATUS-{idx:03d}")
         v = self._parse_status_hex(resp)
         if v is not None and idx in self.data:
-            self.data[idx].status_hex = v
+            self._set_status(idx, v)
             self.async_set_updated_data(self.data)
 
     async def async_refresh_point_battery(self, idx: int) -> None:
         """Refresh a single point's battery from the bridge."""
-        resp = await self._query(f"?POINTBATTERYGET-{idx:03d}", timeout=5.0)
-        m = RE_HEX_DOLLAR.search(resp)
-        if not m:
-            tail = self._after_comma(resp).strip()
-            if tail.startswith("$") and len(tail) == 3:
-                tail = tail[1:]
-            if len(tail) == 2 and all(c in "0123456789abcdefABCDEF" for c in tail):
-                battery_hex = f"${tail.upper()}"
-            else:
-                battery_hex = None
-        else:
-            battery_hex = f"${m.group(1).upper()}"
-
+        resp = await self._query_point(idx, f"?POINTBATTERYGET-{idx:03d}")
+        battery_hex = self._parse_battery_hex(resp)
         if battery_hex is not None and idx in self.data:
             self.data[idx].battery_hex = battery_hex
             self.async_set_updated_data(self.data)
 
+    async def async_query_batch(self, commands: list[str], timeout: float = 5.0) -> list[dict]:
+        """Send raw bridge commands as one batch and correlate each reply.
+
+        Queries ("?...") go through _query so each reply is matched to its
+        command; set commands ("!...") go through _command, which consumes
+        their echo and any reply before the next command is sent. The batch
+        holds the sweep lock so a timed poll can't interleave.
+        """
+        results: list[dict] = []
+        async with self._sweep_lock:
+            for cmd in commands:
+                cmd = cmd.strip()
+                result: dict = {"command": cmd, "raw": None, "parsed": None, "latency_ms": None, "error": None}
+                results.append(result)
+                if not cmd:
+                    result["error"] = "empty command"
+                    continue
+
+                started = time.monotonic()
+                try:
+                    if cmd.startswith("!"):
+                        result["raw"] = await self._command(cmd, timeout=timeout)
+                    else:
+                        raw = await self._query(cmd, timeout=timeout)
+                        result["raw"] = raw
+                        result["parsed"] = self._parse_reply(cmd, raw)
+                except TimeoutError:
+                    result["error"] = "timeout"
+                except ConnectionError as err:
+                    result["error"] = str(err)
+                result["latency_ms"] = round((time.monotonic() - started) * 1000, 1)
+        return results
+
     async def pointset(self, index: int, value_hex: int) -> None:
         idx = f"{index:03d}"
+        # The point is about to change; don't serve its old status from cache.
+        self._query_cache.pop(f"?POINTSTATUS-{idx}", None)
         await self._client.send(f"!POINTSET-{idx},${value_hex:02X}")
 
-    async def _query(self, cmd: str, timeout: float = 5.0) -> str:
+    async def _query_point(self, idx: int, cmd: str, timeout: float | None = None) -> str:
+        """Status/battery read for a single point.
+
+        Answers from a short-TTL cache when possible, and identical queries
+        already in flight share that one bridge round trip instead of queuing
+        behind _cmd_lock again.
+        """
+        cached = self._query_cache.get(cmd)
+        if cached is not None and time.monotonic() - cached[1] < QUERY_CACHE_TTL_SECONDS:
+            self.query_stats["hits"] += 1
+            return cached[0]
+
+        inflight = self._inflight.get(cmd)
+        if inflight is not None:
+            self.query_stats["merged"] += 1
+            return await asyncio.shield(inflight)
+
+        self.query_stats["misses"] += 1
+        fut: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._inflight[cmd] = fut
+        try:
+            resp = await self._query(cmd, timeout=timeout)
+        except TimeoutError as err:
+            self._note_point_failure(idx)
+            fut.set_exception(err)
+            fut.exception()  # mark retrieved in case nobody merged
+            raise
+        except BaseException as err:
+            if isinstance(err, asyncio.CancelledError):
+                fut.cancel()
+            else:
+                fut.set_exception(err)
+                fut.exception()
+            raise
+        else:
+            self._note_point_success(idx)
+            self._query_cache[cmd] = (resp, time.monotonic())
+            fut.set_result(resp)
+            return resp
+        finally:
+            self._inflight.pop(cmd, None)
+
+    async def _query(self, cmd: str, timeout: float | None = None) -> str:
+        if timeout is None:
+            timeout = self._query_timeout
         async with self._cmd_lock:
             if not self._client.is_connected:
                 raise ConnectionError("Not connected")
@@ -366,32 +1130,205 @@ class PellaCoordinator(DataUpdateCoordinator[dict[int, DeviceInfo]]):
                 return await asyncio.wait_for(self._pending, timeout=timeout)
 
             try:
-                return await _send_and_wait()
+                async with self._scheduler.query(self.entry.entry_id):
+                    resp = await _send_and_wait()
             except TimeoutError:
                 _LOGGER.debug("Timeout waiting for response to %s; retrying once", cmd)
-                return await _send_and_wait()
+                try:
+                    async with self._scheduler.query(self.entry.entry_id):
+                        resp = await _send_and_wait()
+                except TimeoutError:
+                    self._note_query_timeout(cmd)
+                    raise
+            finally:
+                self._pending = None
+            self._timeout_streak.clear()
+            self._client.note_reply_ok()
+            return resp
+
+    async def _command(self, cmd: str, timeout: float | None = None) -> str | None:
+        """Send a set command ("!...") serialized with queries.
+
+        Waits for the bridge's echo and then up to COMMAND_SETTLE_SECONDS for
+        a reply line, which is returned (None if the bridge stays quiet).
+        Raises TimeoutError if the command is never echoed.
+        """
+        if timeout is None:
+            timeout = self._query_timeout
+        cmd = cmd.strip()
+        async with self._cmd_lock:
+            if not self._client.is_connected:
+                raise ConnectionError("Not connected")
+            loop = asyncio.get_running_loop()
+            self._echo = loop.create_future()
+            self._pending = loop.create_future()
+            self._last_cmd = cmd
+            try:
+                async with self._scheduler.query(self.entry.entry_id):
+                    await self._client.send(cmd)
+                    await asyncio.wait_for(self._echo, timeout=timeout)
+                    try:
+                        return await asyncio.wait_for(self._pending, timeout=COMMAND_SETTLE_SECONDS)
+                    except TimeoutError:
+                        return None
             finally:
+                self._echo = None
                 self._pending = None
 
-    async def _handle_line(self, line: str) -> None:
+    def _note_query_timeout(self, cmd: str) -> None:
+        """Slow the pacer only when several different queries time out in a row.
+
+        A single dead or out-of-range point times out on every sweep without
+        saying anything about bridge load; health tracking backs it off.
+        """
+        self._timeout_streak.add(cmd)
+        if len(self._timeout_streak) >= PACER_TIMEOUT_QUERIES:
+            self._timeout_streak.clear()
+            self._client.note_reply_error()
+
+    async def async_replay_trace(self, records: list[TraceRecord], speed: float = 1.0) -> ReplayStats:
+        """Replay a protocol capture through _handle_line/_query.
+
+        Only runs on a coordinator that is not started (build a separate one
+        for the replay): a running one has a live reader, timers and proxy
+        that would feed into the replay. The client is swapped for a
+        TraceReplayClient for the duration, so nothing reaches the bridge.
+        speed scales the original timing; speed <= 0 replays as fast as
+        ordering allows.
+        """
+        if self._running:
+            raise RuntimeError("Trace replay needs a coordinator that is not started")
+        replay_client = TraceReplayClient()
+        live_client, self._client = self._client, replay_client
+        try:
+            stats = await async_replay(records, self._handle_line, self._query, replay_client, speed)
+        finally:
+            self._client = live_client
+        self.async_set_updated_data(self.data)
+        return stats
+
+    async def _handle_line(self, line: str, rx_time: float | None = None) -> None:
+        await self._handle_lines([(line, time.monotonic() if rx_time is None else rx_time)])
+
+    async def _handle_lines(self, lines: list[tuple[str, float]]) -> None:
+        """Decode and apply a batch of RX lines on the event loop."""
+        t_dispatch = time.monotonic()
+        self._publish_batch([(line, rx_time, self._decode_line(line)) for line, rx_time in lines], t_dispatch)
+
+    @callback
+    def _handle_decoded(self, batch: list[DecodedLine]) -> None:
+        """Apply a batch the I/O thread has already decoded."""
+        self._publish_batch(batch, time.monotonic())
+
+    @callback
+    def _publish_batch(self, batch: list[DecodedLine], t_dispatch: float) -> None:
+        """Apply a batch of RX lines and publish at most one update for it.
+
+        Each line carries the monotonic time _read_loop received it, so the
+        batch's latency can be split into read -> dispatch -> parse ->
+        coordinator update -> entity writes.
+        """
+        first_rx: float | None = None
+        for line, rx_time, decoded in batch:
+            if self._apply_line(line, decoded, rx_time) and first_rx is None:
+                first_rx = rx_time
+        if first_rx is None:
+            return
+
+        t_parsed = time.monotonic()
+        self._entity_write_s = 0.0
+        self._tracking_writes = True
+        try:
+            self.async_set_updated_data(self.data)
+        finally:
+            self._tracking_writes = False
+        t_done = time.monotonic()
+
+        write_ms = self._entity_write_s * 1000
+        stages = {
+            "read_to_dispatch": (t_dispatch - first_rx) * 1000,
+            "parse": (t_parsed - t_dispatch) * 1000,
+            "coordinator_update": max(0.0, (t_done - t_parsed) * 1000 - write_ms),
+            "entity_write": write_ms,
+            "total": (t_done - first_rx) * 1000,
+        }
+        for stage, ms in stages.items():
+            self.latency.add(stage, ms)
+        if self._latency_events:
+            self.hass.bus.async_fire(
+                EVENT_LATENCY,
+                {"entry_id": self.entry.entry_id, "lines": len(batch), **{f"{k}_ms": round(v, 3) for k, v in stages.items()}},
+            )
+
+    @property
+    def tracking_writes(self) -> bool:
+        """True while an RX batch is being published; entities then time their writes."""
+        return self._tracking_writes
+
+    @callback
+    def note_entity_write(self, elapsed_s: float) -> None:
+        self._entity_write_s += elapsed_s
+
+    def diagnostics(self) -> dict:
+        """Runtime stats plus the data table as a base64 snapshot."""
+        health = [h.state for h in self._health.values()]
+        pacer = getattr(self._client, "pacer", None)
+        return {
+            "points": len(self.data),
+            "connected": self._client.is_connected,
+            "io_thread": isinstance(self._client, ThreadedTelnetClient),
+            "startup_timings": self.startup_timings,
+            "latency": self.latency.summary(),
+            "rx": dict(getattr(self._client, "rx_stats", {})),
+            "offline_queue": dict(getattr(self._client, "queue_stats", {})),
+            "query_cache": dict(self.query_stats),
+            "pacer": {"rate": round(pacer.rate, 2), **pacer.stats} if pacer else None,
+            "health": {state: health.count(state) for state in set(health)},
+            "proxy_clients": self._proxy.client_count if self._proxy else None,
+            "scheduler": self._scheduler.bridge_stats(self.entry.entry_id),
+            "scheduler_fairness": self._scheduler.fairness(),
+            "snapshot": snapshot_to_text(self.export_snapshot()),
+        }
+
+    @staticmethod
+    def _decode_line(line: str) -> tuple[int, str] | None:
+        """(index, status hex) for an unsolicited status line, else None.
+
+        Pure function of the line so the I/O thread can run it.
+        """
         # Unsolicited status format: POINTSTATUS-XXX,VV
         m = RE_UNSOL.match(line)
         if m:
-            idx = int(m.group("idx"))
-            val = m.group("val").upper()
+            return int(m.group("idx")), m.group("val").upper()
+        return None
+
+    def _apply_line(self, line: str, decoded: tuple[int, str] | None, rx_time: float) -> bool:
+        """Apply one RX line; returns True if coordinator data changed."""
+        if decoded is not None:
+            idx, val = decoded
+            self._note_point_success(idx)
+            self._query_cache[f"?POINTSTATUS-{idx:03d}"] = (line, time.monotonic())
             if idx in self.data:
-                self.data[idx].status_hex = val
+                self._set_status(idx, val, rx_time)
             else:
                 self.data[idx] = DeviceInfo(idx, None, None, f"Pella Device ({idx:03d})", val, None)
-            self.async_set_updated_data(self.data)
-            return
-
-        # Ignore echoed command lines
-        if self._last_cmd and line.strip() == self._last_cmd:
-            return
+                self._invalidate_identity(idx)
+                self._async_point_resolved(idx)
+            if self._proxy:
+                self._proxy.broadcast(line)
+            return True
+
+        # Ignore echoed command lines. An echoed set command is never a
+        # query's reply, even when it isn't the command we last sent.
+        stripped = line.strip()
+        if stripped.startswith("!") or (self._last_cmd and stripped == self._last_cmd):
+            if self._echo is not None and not self._echo.done() and stripped == self._last_cmd:
+                self._echo.set_result(None)
+            return False
 
         if self._pending and not self._pending.done():
             self._pending.set_result(line)
+        return False
 
     @staticmethod
     def _after_comma(s: str) -> str:
@@ -411,6 +1348,17 @@ class PellaCoordinator(DataUpdateCoordinator[dict[int, DeviceInfo]]):
             return int(tail, 16)
         return None
 
+    @classmethod
+    def _is_empty_point_reply(cls, s: str) -> bool:
+        """True when a ?POINTDEVICE reply says nothing is paired at that index.
+
+        This is a real answer from the bridge, unlike a timeout.
+        """
+        tail = cls._after_comma(s).strip()
+        if not tail or tail.startswith("?"):
+            return True
+        return cls._parse_device_type(s) in EMPTY_DEVICE_TYPES
+
     @classmethod
     def _parse_point_id(cls, s: str) -> str | None:
         # Common: "S083C57" or "POINTID-001,S083C57"
@@ -441,6 +1389,39 @@ class PellaCoordinator(DataUpdateCoordinator[dict[int, DeviceInfo]]):
             return tail.upper()
         return None
 
+    @classmethod
+    def _parse_reply(cls, cmd: str, s: str) -> str | int | None:
+        """Decode a reply according to the query that produced it."""
+        verb = cmd.upper().split("-", 1)[0]
+        if verb == "?POINTCOUNT":
+            digits = "".join(ch for ch in s if ch.isdigit())
+            return int(digits) if digits else None
+        if verb == "?POINTDEVICE":
+            return cls._parse_device_type(s)
+        if verb == "?POINTID":
+            return cls._parse_point_id(s)
+        if verb == "?POINTSTATUS":
+            return cls._parse_status_hex(s)
+        if verb == "?POINTBATTERYGET":
+            return cls._parse_battery_hex(s)
+        return None
+
+    @classmethod
+    def _parse_battery_hex(cls, s: str) -> str | None:
+        """Parse a POINTBATTERYGET value into "$XX" form.
+
+        Battery responses tend to be $xx but may come as POINTBATTERYGET-XXX,$xx.
+        """
+        m = RE_HEX_DOLLAR.search(s)
+        if m:
+            return f"${m.group(1).upper()}"
+        tail = cls._after_comma(s).strip()
+        if tail.startswith("$") and len(tail) == 3:
+            tail = tail[1:]
+        if len(tail) == 2 and all(c in "0123456789abcdefABCDEF" for c in tail):
+            return f"${tail.upper()}"
+        return None
+
     @staticmethod
     def _default_name(device_type: int | None, index: int, point_id: str | None) -> str:
         suffix = point_id if point_id else f"{index:03d}"
@@ -6,59 +6,48 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DEVICE_SHADE, DOMAIN
-from .coordinator import PellaCoordinator
+from .coordinator import PellaCoordinator, PointIdentity
+from .entity import PellaRestorePointEntity
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
     coord: PellaCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    async_add_entities(
-        [PellaShade(coord, entry.entry_id, idx) for idx, d in coord.data.items() if d.device_type == DEVICE_SHADE],
-        update_before_add=False,
-    )
+    def _entities_for(idx: int) -> list[PellaShade]:
+        dev = coord.data.get(idx)
+        if dev is None or dev.device_type != DEVICE_SHADE or not coord.async_claim_entity(idx, PellaShade._uid_key):
+            return []
+        return [PellaShade(coord, entry.entry_id, idx)]
+
+    entities: list[PellaShade] = []
+    for idx in list(coord.data):
+        entities.extend(_entities_for(idx))
+    if entities:
+        async_add_entities(entities, update_before_add=False)
+        coord.async_note_entities_added(len(entities))
 
     @callback
-    def _on_update() -> None:
-        existing = {e._idx for e in hass.data.setdefault(f"{DOMAIN}_shade_{entry.entry_id}", [])}
-        new = []
-        for idx, d in coord.data.items():
-            if d.device_type == DEVICE_SHADE and idx not in existing:
-                new.append(PellaShade(coord, entry.entry_id, idx))
+    def _on_point(idx: int) -> None:
+        new = _entities_for(idx)
         if new:
             async_add_entities(new, update_before_add=False)
+            coord.async_note_entities_added(len(new))
 
-    coord.async_add_listener(_on_update)
+    entry.async_on_unload(coord.async_add_point_listener(_on_point))
 
 
-class PellaShade(CoverEntity):
+class PellaShade(PellaRestorePointEntity, CoverEntity):
     _attr_supported_features = (
         CoverEntityFeature.OPEN
         | CoverEntityFeature.CLOSE
         | CoverEntityFeature.STOP
         | CoverEntityFeature.SET_POSITION
     )
+    _uid_key = "shade"
 
-    def __init__(self, coord: PellaCoordinator, entry_id: str, idx: int):
-        self.coordinator = coord
-        self._entry_id = entry_id
-        self._idx = idx
-        coord.hass.data.setdefault(f"{DOMAIN}_shade_{entry_id}", []).append(self)
-
-    @property
-    def device_info(self):
-        return self.coordinator.point_device_info(self._idx)
-
-    @property
-    def unique_id(self) -> str:
-        dev = self.coordinator.data.get(self._idx)
-        base = dev.point_id if dev and dev.point_id else f"point_{self._idx:03d}"
-        return f"{self._entry_id}_shade_{base}"
-
-    @property
-    def name(self) -> str:
-        dev = self.coordinator.data.get(self._idx)
-        if dev:
-            return dev.name.replace("Pella Shade", "Shade")
+    def _format_name(self, ident: PointIdentity) -> str:
+        if self._dev:
+            return ident.label.replace("Pella Shade", "Shade")
         return f"Shade {self._idx:03d}"
 
     @property
@@ -86,10 +75,3 @@ class PellaShade(CoverEntity):
         pos = int(kwargs["position"])
         pos = max(0, min(100, pos))
         await self.coordinator.set_shade_position(self._idx, pos)
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        self.async_write_ha_state()
-
-    async def async_added_to_hass(self) -> None:
-        self.async_on_remove(self.coordinator.async_add_listener(self._handle_coordinator_update))
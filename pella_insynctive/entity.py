@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import time
+
+from homeassistant.core import callback
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.restore_state import ExtraStoredData, RestoreEntity
+
+from .coordinator import DeviceInfo, PellaCoordinator, PointIdentity
+
+
+class PellaPointEntity(Entity):
+    """Base for entities bound to one bridge point.
+
+    unique_id is fixed when the entity is created (see
+    PellaCoordinator.entity_unique_id): a point first seen by index keeps its
+    point_XXX id after discovery learns the point id. name is formatted once
+    per PointIdentity and reused until the coordinator hands out a new one
+    (name or overrides changed).
+    """
+
+    # Subclasses set these; unique_id is "<entry>_<_uid_key>_<point base>",
+    # name is "<point label> <_name_suffix>".
+    _uid_key: str = ""
+    _name_suffix: str = ""
+    # Whether to write state on every coordinator update.
+    _follow_coordinator: bool = True
+
+    def __init__(self, coord: PellaCoordinator, entry_id: str, idx: int):
+        self.coordinator = coord
+        self._entry_id = entry_id
+        self._idx = idx
+        self._ident: PointIdentity | None = None
+        self._label = ""
+        self._uid = coord.entity_unique_id(self._uid_key, idx)
+
+    def _identity(self) -> PointIdentity:
+        ident = self.coordinator.point_identity(self._idx)
+        if ident is not self._ident:
+            self._ident = ident
+            self._label = self._format_name(ident)
+        return ident
+
+    def _format_name(self, ident: PointIdentity) -> str:
+        return f"{ident.label} {self._name_suffix}"
+
+    @property
+    def unique_id(self) -> str:
+        return self._uid
+
+    @property
+    def name(self) -> str:
+        self._identity()
+        return self._label
+
+    @property
+    def device_info(self):
+        return self._identity().device_info
+
+    @property
+    def _dev(self) -> DeviceInfo | None:
+        return self.coordinator.data.get(self._idx)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        if not self.coordinator.tracking_writes:
+            self.async_write_ha_state()
+            return
+        started = time.monotonic()
+        self.async_write_ha_state()
+        self.coordinator.note_entity_write(time.monotonic() - started)
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        if self._follow_coordinator:
+            self.async_on_remove(self.coordinator.async_add_listener(self._handle_coordinator_update))
+
+
+class PellaRestorePointEntity(PellaPointEntity, RestoreEntity):
+    """Point entity that persists its point's data and seeds it on restart."""
+
+    @property
+    def extra_restore_state_data(self) -> ExtraStoredData | None:
+        return self.coordinator.point_restore_data(self._idx)
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        if (extra := await self.async_get_last_extra_data()) is not None:
+            self.coordinator.async_seed_point(extra.as_dict())
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from collections.abc import Callable
+
+from .client import TelnetClient, TelnetClientConfig, TokenBucket
+
+_LOGGER = logging.getLogger(__name__)
+
+# (line, monotonic receive time, decoded (index, status hex) or None)
+DecodedLine = tuple[str, float, tuple[int, str] | None]
+Decoder = Callable[[str], tuple[int, str] | None]
+BatchCallback = Callable[[list[DecodedLine]], None]
+
+
+class ThreadedTelnetClient:
+    """Runs TelnetClient and line decoding on a private loop in a worker thread.
+
+    Exposes the same surface the coordinator uses on TelnetClient. Each RX
+    batch is decoded in the worker and handed to the main loop with a single
+    call_soon_threadsafe, so the main loop never touches the socket.
+
+    Calls still running on the worker when it stops are cancelled there and
+    fail with ConnectionError on the main loop, as do calls made afterwards.
+    """
+
+    def __init__(
+        self,
+        cfg: TelnetClientConfig,
+        decode: Decoder,
+        on_batch: BatchCallback,
+        main_loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        self._cfg = cfg
+        self._decode = decode
+        self._on_batch = on_batch
+        self._main_loop = main_loop
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._client: TelnetClient | None = None
+        self._inflight: set[concurrent.futures.Future] = set()
+        self._stopping = False
+
+    # -- lifecycle -----------------------------------------------------------
+
+    async def start(self) -> None:
+        ready = threading.Event()
+        self._thread = threading.Thread(target=self._thread_main, args=(ready,), name="pella_insynctive_io", daemon=True)
+        self._thread.start()
+        await self._main_loop.run_in_executor(None, ready.wait)
+        await self._call(self._bootstrap())
+
+    async def stop(self) -> None:
+        loop, thread = self._loop, self._thread
+        if loop is None or thread is None:
+            return
+        self._stopping = True
+        try:
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(self._shutdown(), loop))
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            await self._main_loop.run_in_executor(None, thread.join, 5)
+            # Only left if the worker didn't get to them; fail them here.
+            for fut in list(self._inflight):
+                try:
+                    fut.set_exception(ConnectionError("I/O thread stopped"))
+                except concurrent.futures.InvalidStateError:
+                    pass
+            self._inflight.clear()
+            self._loop = None
+            self._thread = None
+            self._client = None
+            self._stopping = False
+
+    def _thread_main(self, ready: threading.Event) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._loop = loop
+        ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    async def _bootstrap(self) -> None:
+        # Built on the worker loop so its events and queues belong there.
+        self._client = TelnetClient(self._cfg, on_lines=self._worker_on_lines)
+        await self._client.start()
+
+    async def _shutdown(self) -> None:
+        # Runs on the worker. Anything still in flight (e.g. a send waiting on
+        # the pacer) is cancelled so its main-loop caller doesn't wait forever
+        # on a loop that is about to stop.
+        if self._client is not None:
+            await self._client.stop()
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _call(self, coro):
+        if self._loop is None or self._stopping:
+            coro.close()
+            raise ConnectionError("I/O thread not running")
+        fut = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        self._inflight.add(fut)
+        fut.add_done_callback(self._inflight.discard)
+        try:
+            return await asyncio.wrap_future(fut)
+        except asyncio.CancelledError:
+            # Cancelled by stop() rather than by our own caller.
+            task = asyncio.current_task()
+            if fut.cancelled() and not (task and task.cancelling()):
+                raise ConnectionError("I/O thread stopped") from None
+            raise
+
+    # -- worker side ---------------------------------------------------------
+
+    async def _worker_on_lines(self, lines: list[tuple[str, float]]) -> None:
+        batch = [(line, rx_time, self._decode(line)) for line, rx_time in lines]
+        self._main_loop.call_soon_threadsafe(self._on_batch, batch)
+
+    # -- TelnetClient surface -------------------------------------------------
+
+    @property
+    def is_connected(self) -> bool:
+        return self._client is not None and self._client.is_connected
+
+    @property
+    def pacer(self) -> TokenBucket | None:
+        return self._client.pacer if self._client else None
+
+    @property
+    def rx_stats(self) -> dict:
+        return dict(self._client.rx_stats) if self._client else {}
+
+    @property
+    def queue_stats(self) -> dict:
+        return dict(self._client.queue_stats) if self._client else {}
+
+    async def wait_connected(self, timeout: float) -> bool:
+        if self._client is None:
+            return False
+        return await self._call(self._client.wait_connected(timeout))
+
+    async def send(self, command: str) -> None:
+        if self._client is None:
+            _LOGGER.debug("TX dropped (I/O thread not running): %s", command)
+            return
+        await self._call(self._client.send(command))
+
+    def note_reply_ok(self) -> None:
+        if self._loop and self._client:
+            self._loop.call_soon_threadsafe(self._client.note_reply_ok)
+
+    def note_reply_error(self) -> None:
+        if self._loop and self._client:
+            self._loop.call_soon_threadsafe(self._client.note_reply_error)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from collections import deque
+
+# Samples kept per stage for the rolling percentiles.
+WINDOW = 512
+
+
+class RollingStats:
+    """Rolling window of samples (ms) with on-demand percentiles."""
+
+    def __init__(self, window: int = WINDOW) -> None:
+        self._samples: deque[float] = deque(maxlen=window)
+        self.count = 0
+
+    def add(self, value_ms: float) -> None:
+        self._samples.append(value_ms)
+        self.count += 1
+
+    def mean(self) -> float:
+        return sum(self._samples) / len(self._samples) if self._samples else 0.0
+
+    def summary(self) -> dict:
+        if not self._samples:
+            return {"count": self.count}
+        ordered = sorted(self._samples)
+        last = len(ordered) - 1
+
+        def pct(p: float) -> float:
+            return round(ordered[min(last, int(round(p * last)))], 2)
+
+        return {
+            "count": self.count,
+            "p50_ms": pct(0.50),
+            "p95_ms": pct(0.95),
+            "p99_ms": pct(0.99),
+            "max_ms": round(ordered[-1], 2),
+        }
+
+
+class StageTimings:
+    """Named RollingStats, one per pipeline stage."""
+
+    def __init__(self, *stages: str) -> None:
+        self._stages = {name: RollingStats() for name in stages}
+
+    def add(self, stage: str, value_ms: float) -> None:
+        self._stages[stage].add(value_ms)
+
+    def summary(self) -> dict:
+        return {name: stats.summary() for name, stats in self._stages.items()}
@@ -7,15 +7,35 @@ from homeassistant.helpers import selector
 
 from .const import (
     DEFAULT_BATTERY_POLL_MINUTES,
+    DEFAULT_IO_THREAD,
+    DEFAULT_TRANSITION_EVENTS,
+    DEFAULT_LATENCY_EVENTS,
+    DEFAULT_DISCOVERY_EMPTY_RUN,
     DEFAULT_POLL_INTERVAL_SECONDS,
+    DEFAULT_PROXY_BIND_HOST,
+    DEFAULT_PROXY_PORT,
+    DEFAULT_QUERY_TIMEOUT_SECONDS,
     DEFAULT_RECONNECT_MAX_SECONDS,
     DEFAULT_RECONNECT_MIN_SECONDS,
     DEFAULT_SCAN_ALL_128,
+    DEFAULT_SEND_RATE_MAX,
+    DEFAULT_TRACE_PROTOCOL,
     OPT_BATTERY_POLL_MINUTES,
+    OPT_IO_THREAD,
+    OPT_TRANSITION_EVENTS,
+    OPT_TRANSITION_KINDS,
+    OPT_TRANSITION_POINTS,
+    OPT_LATENCY_EVENTS,
+    OPT_DISCOVERY_EMPTY_RUN,
     OPT_POLL_INTERVAL_SECONDS,
+    OPT_PROXY_BIND_HOST,
+    OPT_PROXY_PORT,
+    OPT_QUERY_TIMEOUT_SECONDS,
     OPT_RECONNECT_MAX_SECONDS,
     OPT_RECONNECT_MIN_SECONDS,
     OPT_SCAN_ALL_128,
+    OPT_SEND_RATE_MAX,
+    OPT_TRACE_PROTOCOL,
     OPT_DEVICE_NAME_PREFIX,
     OPT_DEVICE_AREA_PREFIX,
     DOMAIN,
@@ -72,6 +92,50 @@ class PellaOptionsFlowHandler(OptionsFlow):
                     OPT_SCAN_ALL_128,
                     default=o.get(OPT_SCAN_ALL_128, DEFAULT_SCAN_ALL_128),
                 ): bool,
+                vol.Optional(
+                    OPT_DISCOVERY_EMPTY_RUN,
+                    default=o.get(OPT_DISCOVERY_EMPTY_RUN, DEFAULT_DISCOVERY_EMPTY_RUN),
+                ): vol.Coerce(int),
+                vol.Optional(
+                    OPT_QUERY_TIMEOUT_SECONDS,
+                    default=o.get(OPT_QUERY_TIMEOUT_SECONDS, DEFAULT_QUERY_TIMEOUT_SECONDS),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0.5, max=30)),
+                vol.Optional(
+                    OPT_SEND_RATE_MAX,
+                    default=o.get(OPT_SEND_RATE_MAX, DEFAULT_SEND_RATE_MAX),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(
+                    OPT_PROXY_PORT,
+                    default=o.get(OPT_PROXY_PORT, DEFAULT_PROXY_PORT),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=65535)),
+                vol.Optional(
+                    OPT_PROXY_BIND_HOST,
+                    default=o.get(OPT_PROXY_BIND_HOST, DEFAULT_PROXY_BIND_HOST),
+                ): str,
+                vol.Optional(
+                    OPT_TRACE_PROTOCOL,
+                    default=o.get(OPT_TRACE_PROTOCOL, DEFAULT_TRACE_PROTOCOL),
+                ): bool,
+                vol.Optional(
+                    OPT_TRANSITION_EVENTS,
+                    default=o.get(OPT_TRANSITION_EVENTS, DEFAULT_TRANSITION_EVENTS),
+                ): bool,
+                vol.Optional(
+                    OPT_TRANSITION_POINTS,
+                    default=o.get(OPT_TRANSITION_POINTS, ""),
+                ): str,
+                vol.Optional(
+                    OPT_TRANSITION_KINDS,
+                    default=o.get(OPT_TRANSITION_KINDS, ""),
+                ): str,
+                vol.Optional(
+                    OPT_IO_THREAD,
+                    default=o.get(OPT_IO_THREAD, DEFAULT_IO_THREAD),
+                ): bool,
+                vol.Optional(
+                    OPT_LATENCY_EVENTS,
+                    default=o.get(OPT_LATENCY_EVENTS, DEFAULT_LATENCY_EVENTS),
+                ): bool,
                 **device_options,
             }
         )
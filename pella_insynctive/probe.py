@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from dataclasses import dataclass, field
+
+from .const import (
+    DEFAULT_BATTERY_POLL_MINUTES,
+    DEFAULT_POLL_INTERVAL_SECONDS,
+    DEFAULT_QUERY_TIMEOUT_SECONDS,
+    OPT_BATTERY_POLL_MINUTES,
+    OPT_POLL_INTERVAL_SECONDS,
+    OPT_QUERY_TIMEOUT_SECONDS,
+    OPT_SCAN_ALL_128,
+    PROBE_CONNECT_TIMEOUT_SECONDS,
+    PROBE_MAX_SECONDS,
+    PROBE_QUERY_TIMEOUT_SECONDS,
+    PROBE_STATUS_SAMPLES,
+)
+from .coordinator import RE_UNSOL, PellaCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class ProbeResult:
+    point_count: int | None = None
+    # Measured queries (?POINTCOUNT and status samples). ?POINTDEVICE lookups
+    # are kept out: an empty slot may stay silent, which says nothing about
+    # the link.
+    sent: int = 0
+    answered: int = 0
+    lookups_answered: int = 0
+    rtt_ms: list[float] = field(default_factory=list)
+
+    @property
+    def responded(self) -> bool:
+        return bool(self.answered or self.lookups_answered)
+
+    @property
+    def drop_rate(self) -> float:
+        return 0.0 if not self.sent else round(1 - self.answered / self.sent, 3)
+
+    @property
+    def rtt_max_ms(self) -> float | None:
+        return max(self.rtt_ms) if self.rtt_ms else None
+
+    def suggested_options(self) -> dict:
+        """Starting options derived from what the bridge just showed us."""
+        count = self.point_count or 0
+        rtt_s = (self.rtt_max_ms or 0) / 1000
+
+        # Leave the bridge idle most of the time: a status sweep should take
+        # well under 10% of the poll interval.
+        sweep_s = count * rtt_s
+        poll_s = max(DEFAULT_POLL_INTERVAL_SECONDS, int(math.ceil(sweep_s * 10 / 60.0)) * 60)
+
+        battery_min = DEFAULT_BATTERY_POLL_MINUTES
+        if self.drop_rate > 0:
+            # A lossy link makes every sweep slower; poll batteries less often.
+            battery_min *= 2
+
+        # Several times the worst RTT we saw, bounded to something sane.
+        timeout_s = DEFAULT_QUERY_TIMEOUT_SECONDS
+        if self.rtt_ms:
+            timeout_s = min(10.0, max(2.0, round(rtt_s * 4, 1)))
+
+        return {
+            OPT_POLL_INTERVAL_SECONDS: poll_s,
+            OPT_BATTERY_POLL_MINUTES: battery_min,
+            OPT_QUERY_TIMEOUT_SECONDS: timeout_s,
+            OPT_SCAN_ALL_128: count == 0,
+        }
+
+
+async def async_probe_bridge(host: str, port: int) -> ProbeResult:
+    """Open a short trial session and measure the bridge.
+
+    Uses one plain connection rather than the reconnecting TelnetClient, so
+    a refused or unreachable bridge fails at once. Status samples only go to
+    indices ?POINTDEVICE reports as paired, and the whole probe stops asking
+    after PROBE_MAX_SECONDS. Raises ConnectionError if the bridge can't be
+    reached.
+    """
+    try:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port), timeout=PROBE_CONNECT_TIMEOUT_SECONDS
+        )
+    except (OSError, asyncio.TimeoutError) as err:
+        raise ConnectionError(f"Could not connect to {host}:{port}: {err}") from err
+
+    result = ProbeResult()
+    deadline = time.monotonic() + PROBE_MAX_SECONDS
+
+    async def _read_reply(cmd: str) -> str:
+        while True:
+            raw = await reader.readline()
+            if not raw:
+                raise ConnectionError("Socket closed")
+            line = raw.decode("utf-8", errors="ignore").strip()
+            # The bridge echoes each command before answering, and may push
+            # POINTSTATUS lines at any time.
+            if line and line != cmd and not RE_UNSOL.match(line):
+                return line
+
+    async def _ask(cmd: str, measured: bool = True) -> str | None:
+        timeout = min(PROBE_QUERY_TIMEOUT_SECONDS, deadline - time.monotonic())
+        if timeout <= 0:
+            return None
+        started = time.monotonic()
+        writer.write((cmd + "\r\n").encode("utf-8"))
+        await writer.drain()
+        try:
+            reply = await asyncio.wait_for(_read_reply(cmd), timeout=timeout)
+        except asyncio.TimeoutError:
+            # Only a full-length timeout counts as a drop, not one cut short
+            # by the deadline.
+            if measured and timeout >= PROBE_QUERY_TIMEOUT_SECONDS:
+                result.sent += 1
+            return None
+        if measured:
+            result.sent += 1
+            result.answered += 1
+            result.rtt_ms.append(round((time.monotonic() - started) * 1000, 1))
+        else:
+            result.lookups_answered += 1
+        return reply
+
+    try:
+        count_raw = await _ask("?POINTCOUNT")
+        if count_raw is not None:
+            result.point_count = PellaCoordinator._parse_reply("?POINTCOUNT", count_raw)
+
+        sampled = 0
+        for i in range(1, (result.point_count or PROBE_STATUS_SAMPLES) + 1):
+            if sampled >= PROBE_STATUS_SAMPLES or time.monotonic() >= deadline:
+                break
+            device = await _ask(f"?POINTDEVICE-{i:03d}", measured=False)
+            if device is None or PellaCoordinator._is_empty_point_reply(device):
+                continue
+            await _ask(f"?POINTSTATUS-{i:03d}")
+            sampled += 1
+    except OSError as err:
+        raise ConnectionError(f"Lost connection to {host}:{port}: {err}") from err
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+
+    _LOGGER.debug(
+        "Probe of %s:%s: count=%s sent=%s answered=%s rtt_ms=%s",
+        host, port, result.point_count, result.sent, result.answered, result.rtt_ms,
+    )
+    return result
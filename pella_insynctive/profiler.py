@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import cProfile
+import functools
+import inspect
+import io
+import json
+import logging
+import pstats
+import time
+from typing import Any
+
+from .metrics import RollingStats
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class Profiler:
+    """Times selected methods of live objects for a bounded window.
+
+    Instrumentation shadows each method with an instance attribute and
+    removes it again on finish, so nothing is left in the hot path while
+    profiling is off. When cProfile capture is on it is enabled only while a
+    synchronous instrumented callback runs; coroutines are timed wall-clock
+    only, since a profiler left on across an await would also record every
+    other task on the loop.
+    """
+
+    def __init__(self, use_cprofile: bool = False) -> None:
+        self.started_at = time.time()
+        self._t0 = time.monotonic()
+        self._timings: dict[str, RollingStats] = {}
+        self._totals: dict[str, float] = {}
+        self._patched: list[tuple[object, str]] = []
+        self._cprofile = cProfile.Profile() if use_cprofile else None
+        self._cprofile_depth = 0
+
+    @property
+    def elapsed_s(self) -> float:
+        return time.monotonic() - self._t0
+
+    def instrument(self, obj: object, prefix: str, names: tuple[str, ...]) -> None:
+        for name in names:
+            method = getattr(obj, name)
+            key = f"{prefix}.{name}"
+            if inspect.iscoroutinefunction(method):
+                wrapper = self._wrap_async(key, method)
+            else:
+                wrapper = self._wrap_sync(key, method)
+            setattr(obj, name, wrapper)
+            self._patched.append((obj, name))
+
+    def restore(self) -> None:
+        for obj, name in self._patched:
+            try:
+                delattr(obj, name)
+            except AttributeError:
+                pass
+        self._patched.clear()
+        if self._cprofile is not None and self._cprofile_depth:
+            self._cprofile.disable()
+            self._cprofile_depth = 0
+
+    def _add(self, key: str, elapsed_s: float) -> None:
+        stats = self._timings.get(key)
+        if stats is None:
+            stats = self._timings[key] = RollingStats()
+        stats.add(elapsed_s * 1000)
+        self._totals[key] = self._totals.get(key, 0.0) + elapsed_s
+
+    def _wrap_async(self, key: str, method):
+        @functools.wraps(method)
+        async def wrapper(*args, **kwargs):
+            started = time.monotonic()
+            try:
+                return await method(*args, **kwargs)
+            finally:
+                self._add(key, time.monotonic() - started)
+
+        return wrapper
+
+    def _wrap_sync(self, key: str, method):
+        prof = self._cprofile
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            started = time.monotonic()
+            if prof is not None:
+                if not self._cprofile_depth:
+                    prof.enable()
+                self._cprofile_depth += 1
+            try:
+                return method(*args, **kwargs)
+            finally:
+                if prof is not None:
+                    self._cprofile_depth -= 1
+                    if not self._cprofile_depth:
+                        prof.disable()
+                self._add(key, time.monotonic() - started)
+
+        return wrapper
+
+    def report(self, max_bytes: int, top: int) -> str:
+        """JSON report, trimmed to max_bytes by dropping cProfile rows."""
+        timings = {
+            key: {**stats.summary(), "total_ms": round(self._totals[key] * 1000, 2)}
+            for key, stats in sorted(self._timings.items())
+        }
+        report: dict[str, Any] = {
+            "started_at": self.started_at,
+            "duration_s": round(self.elapsed_s, 1),
+            "timings": timings,
+        }
+        rows = self._cprofile_rows(top) if self._cprofile is not None else []
+        while True:
+            if self._cprofile is not None:
+                report["cprofile"] = rows
+            text = json.dumps(report, indent=1)
+            if len(text) <= max_bytes or not rows:
+                return text
+            rows = rows[: len(rows) // 2]
+
+    def _cprofile_rows(self, top: int) -> list[dict]:
+        assert self._cprofile is not None
+        stats = pstats.Stats(self._cprofile, stream=io.StringIO())
+        if not stats.stats:  # type: ignore[attr-defined]
+            return []
+        stats.sort_stats(pstats.SortKey.CUMULATIVE)
+        rows = []
+        for func in stats.fcn_list[:top]:  # type: ignore[attr-defined]
+            _cc, ncalls, tottime, cumtime, _callers = stats.stats[func]  # type: ignore[attr-defined]
+            filename, line, name = func
+            rows.append(
+                {
+                    "function": f"{filename}:{line}({name})",
+                    "calls": ncalls,
+                    "tottime_ms": round(tottime * 1000, 3),
+                    "cumtime_ms": round(cumtime * 1000, 3),
+                }
+            )
+        return rows
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+QueryCallback = Callable[[str], Awaitable[str]]
+SendCallback = Callable[[str], Awaitable[str | None]]
+
+
+class BridgeProxy:
+    """Local telnet fan-out in front of the single upstream bridge session.
+
+    Downstream clients speak the same line protocol as the bridge. Their
+    queries ("?...") are serialized onto the upstream connection through the
+    coordinator's query path and each reply is written back only to the
+    client that asked; set commands ("!...") take the same serialized path and
+    any reply they get goes back to the sender as well. Unsolicited
+    POINTSTATUS lines are broadcast to every client; a client that stops
+    reading is disconnected once max_buffer bytes are waiting for it.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        query: QueryCallback,
+        send: SendCallback,
+        max_clients: int = 8,
+        max_buffer: int = 64 * 1024,
+    ) -> None:
+        self._host = host
+        self._port = port
+        self._query = query
+        self._send = send
+        self._max_clients = max_clients
+        self._max_buffer = max_buffer
+
+        self._server: asyncio.AbstractServer | None = None
+        self._clients: dict[asyncio.StreamWriter, asyncio.Task] = {}
+
+    @property
+    def client_count(self) -> int:
+        return len(self._clients)
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle_client, self._host, self._port)
+        _LOGGER.info("Bridge proxy listening on %s:%s", self._host, self._port)
+
+    async def stop(self) -> None:
+        server, self._server = self._server, None
+        if server:
+            server.close()
+        # Closing each writer ends its reader loop, which then deregisters itself.
+        tasks = list(self._clients.values())
+        for writer in list(self._clients):
+            writer.close()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._clients.clear()
+        if server:
+            await server.wait_closed()
+
+    def broadcast(self, line: str) -> None:
+        """Relay an unsolicited line to every downstream client."""
+        data = (line + "\r\n").encode("utf-8", errors="ignore")
+        for writer in list(self._clients):
+            if writer.is_closing():
+                continue
+            if writer.transport.get_write_buffer_size() > self._max_buffer:
+                # close() would wait for the backlog to flush; abort ends the
+                # client's reader loop now, which then deregisters itself.
+                _LOGGER.warning(
+                    "Bridge proxy dropping %s: more than %s bytes unread",
+                    writer.get_extra_info("peername"),
+                    self._max_buffer,
+                )
+                writer.transport.abort()
+                continue
+            writer.write(data)
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        peer = writer.get_extra_info("peername")
+        if len(self._clients) >= self._max_clients:
+            _LOGGER.warning("Bridge proxy rejecting %s: %s clients already connected", peer, self._max_clients)
+            writer.close()
+            return
+
+        task = asyncio.current_task()
+        assert task is not None
+        self._clients[writer] = task
+        _LOGGER.debug("Bridge proxy client connected: %s", peer)
+        try:
+            while True:
+                raw = await reader.readline()
+                if not raw:
+                    break
+                line = raw.decode("utf-8", errors="ignore").strip()
+                if not line:
+                    continue
+                await self._relay(line, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._clients.pop(writer, None)
+            writer.close()
+            _LOGGER.debug("Bridge proxy client disconnected: %s", peer)
+
+    async def _relay(self, line: str, writer: asyncio.StreamWriter) -> None:
+        try:
+            if line.startswith("?"):
+                reply = await self._query(line)
+            else:
+                reply = await self._send(line)
+        except (TimeoutError, ConnectionError) as err:
+            _LOGGER.debug("Bridge proxy command %s failed: %s", line, err)
+            return
+        if reply is None:
+            return
+        writer.write((reply + "\r\n").encode("utf-8", errors="ignore"))
+        await writer.drain()
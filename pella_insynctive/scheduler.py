@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+
+from .const import DOMAIN, SCHEDULER_MAX_INFLIGHT_QUERIES, SCHEDULER_MAX_SWEEPS
+from .metrics import RollingStats
+
+SCHEDULER_DATA = f"{DOMAIN}_scheduler"
+
+# Successive bridges start their timers this fraction of the interval apart
+# (golden ratio), which keeps phases spread out however many bridges load.
+_PHASE_STEP = 0.6180339887
+
+
+@dataclass
+class BridgeSchedStats:
+    slot: int
+    sweeps: int = 0
+    queries: int = 0
+    publishes: int = 0
+    sweep_wait: RollingStats = field(default_factory=RollingStats)
+    query_wait: RollingStats = field(default_factory=RollingStats)
+
+    def summary(self) -> dict:
+        return {
+            "slot": self.slot,
+            "sweeps": self.sweeps,
+            "queries": self.queries,
+            "publishes": self.publishes,
+            "sweep_wait": self.sweep_wait.summary(),
+            "query_wait": self.query_wait.summary(),
+        }
+
+
+class SweepScheduler:
+    """Shares the event loop fairly between every loaded bridge.
+
+    - Poll and battery timers are phase-shifted per bridge so sweeps on
+      different bridges don't all start on the same tick.
+    - At most max_sweeps sweeps run at once; the rest queue FIFO.
+    - At most max_queries bridge queries are in flight domain-wide.
+    - Sweep results are published one bridge per loop iteration, so several
+      128-point fan-outs never run back to back in one callback.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        max_sweeps: int = SCHEDULER_MAX_SWEEPS,
+        max_queries: int = SCHEDULER_MAX_INFLIGHT_QUERIES,
+    ) -> None:
+        self.hass = hass
+        self._sweeps = asyncio.Semaphore(max_sweeps)
+        self._queries = asyncio.Semaphore(max_queries)
+        self._write_lock = asyncio.Lock()
+        self._bridges: dict[str, BridgeSchedStats] = {}
+
+    # -- membership ----------------------------------------------------------
+
+    @callback
+    def register(self, entry_id: str) -> None:
+        if entry_id in self._bridges:
+            return
+        used = {b.slot for b in self._bridges.values()}
+        slot = next(i for i in range(len(used) + 1) if i not in used)
+        self._bridges[entry_id] = BridgeSchedStats(slot)
+
+    @callback
+    def unregister(self, entry_id: str) -> None:
+        self._bridges.pop(entry_id, None)
+
+    def _stats(self, entry_id: str) -> BridgeSchedStats:
+        # Unregistered callers (e.g. a query racing unload) are still budgeted,
+        # just not counted.
+        return self._bridges.get(entry_id) or BridgeSchedStats(slot=0)
+
+    # -- timers --------------------------------------------------------------
+
+    def phase(self, entry_id: str, interval: timedelta) -> float:
+        """Seconds this bridge's timer is shifted by within interval."""
+        frac = (self._stats(entry_id).slot * _PHASE_STEP) % 1.0
+        return interval.total_seconds() * frac
+
+    @callback
+    def async_track_interval(
+        self,
+        entry_id: str,
+        action: Callable[[datetime], Awaitable[None]],
+        interval: timedelta,
+    ) -> CALLBACK_TYPE:
+        """async_track_time_interval, started at this bridge's phase."""
+        unsub: CALLBACK_TYPE | None = None
+
+        @callback
+        def _start(_now) -> None:
+            nonlocal unsub
+            unsub = async_track_time_interval(self.hass, action, interval)
+
+        unsub = async_call_later(self.hass, self.phase(entry_id, interval), _start)
+
+        @callback
+        def _cancel() -> None:
+            if unsub is not None:
+                unsub()
+
+        return _cancel
+
+    # -- budgets -------------------------------------------------------------
+
+    @asynccontextmanager
+    async def sweep(self, entry_id: str) -> AsyncIterator[None]:
+        stats = self._stats(entry_id)
+        started = time.monotonic()
+        async with self._sweeps:
+            stats.sweep_wait.add((time.monotonic() - started) * 1000)
+            stats.sweeps += 1
+            yield
+
+    @asynccontextmanager
+    async def query(self, entry_id: str) -> AsyncIterator[None]:
+        stats = self._stats(entry_id)
+        started = time.monotonic()
+        async with self._queries:
+            stats.query_wait.add((time.monotonic() - started) * 1000)
+            stats.queries += 1
+            yield
+
+    async def async_publish(self, entry_id: str, publish: Callable[[], None]) -> None:
+        """Run a sweep's coordinator update, one bridge per loop iteration."""
+        async with self._write_lock:
+            publish()
+            self._stats(entry_id).publishes += 1
+            # Let the loop run before the next bridge's fan-out.
+            await asyncio.sleep(0)
+
+    # -- reporting -----------------------------------------------------------
+
+    def bridge_stats(self, entry_id: str) -> dict | None:
+        stats = self._bridges.get(entry_id)
+        return stats.summary() if stats else None
+
+    def fairness(self) -> dict:
+        """Jain's index (1.0 = perfectly even) over per-bridge mean query waits."""
+        waits = [stats.query_wait.mean() for stats in self._bridges.values()]
+        total = sum(waits)
+        if not waits or total == 0:
+            index = 1.0
+        else:
+            index = total * total / (len(waits) * sum(w * w for w in waits))
+        return {"bridges": len(waits), "query_wait_jain": round(index, 3)}
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> SweepScheduler:
+    scheduler: SweepScheduler | None = hass.data.get(SCHEDULER_DATA)
+    if scheduler is None:
+        scheduler = hass.data[SCHEDULER_DATA] = SweepScheduler(hass)
+    return scheduler
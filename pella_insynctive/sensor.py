@@ -9,71 +9,42 @@ from homeassistant.helpers.entity import EntityCategory
 
 from .const import DOMAIN
 from .coordinator import PellaCoordinator
+from .entity import PellaRestorePointEntity
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
     coord: PellaCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[SensorEntity] = []
-    for idx in coord.data:
-        entities.append(PellaBatterySensor(coord, entry.entry_id, idx))
-        entities.append(PellaBridgeIndexSensor(coord, entry.entry_id, idx))
-        entities.append(PellaRawStatusSensor(coord, entry.entry_id, idx))
+    def _entities_for(idx: int) -> list[SensorEntity]:
+        classes = (PellaBatterySensor, PellaBridgeIndexSensor, PellaRawStatusSensor)
+        return [cls(coord, entry.entry_id, idx) for cls in classes if coord.async_claim_entity(idx, cls._uid_key)]
 
-    async_add_entities(entities, update_before_add=False)
+    entities: list[SensorEntity] = []
+    for idx in list(coord.data):
+        entities.extend(_entities_for(idx))
+    if entities:
+        async_add_entities(entities, update_before_add=False)
+        coord.async_note_entities_added(len(entities))
 
     @callback
-    def _on_update() -> None:
-        existing = {e.unique_id for e in hass.data.setdefault(f"{DOMAIN}_sens_{entry.entry_id}", [])}
-        new = []
-        for idx in coord.data:
-            for cls in (PellaBatterySensor, PellaBridgeIndexSensor, PellaRawStatusSensor):
-                ent = cls(coord, entry.entry_id, idx)
-                if ent.unique_id not in existing:
-                    new.append(ent)
+    def _on_point(idx: int) -> None:
+        new = _entities_for(idx)
         if new:
             async_add_entities(new, update_before_add=False)
+            coord.async_note_entities_added(len(new))
 
-    coord.async_add_listener(_on_update)
-
-
-class _BaseSensor(SensorEntity):
-    def __init__(self, coord: PellaCoordinator, entry_id: str, idx: int):
-        self.coordinator = coord
-        self._entry_id = entry_id
-        self._idx = idx
-        coord.hass.data.setdefault(f"{DOMAIN}_sens_{entry_id}", []).append(self)
-
-    @property
-    def device_info(self):
-        return self.coordinator.point_device_info(self._idx)
-
-    @property
-    def _dev(self):
-        return self.coordinator.data.get(self._idx)
+    entry.async_on_unload(coord.async_add_point_listener(_on_point))
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        self.async_write_ha_state()
 
-    async def async_added_to_hass(self) -> None:
-        self.async_on_remove(self.coordinator.async_add_listener(self._handle_coordinator_update))
+class _BaseSensor(PellaRestorePointEntity, SensorEntity):
+    """Per-point sensor."""
 
 
 class PellaBatterySensor(_BaseSensor):
     _attr_device_class = SensorDeviceClass.BATTERY
     _attr_native_unit_of_measurement = PERCENTAGE
-
-    @property
-    def unique_id(self) -> str:
-        base = self._dev.point_id if self._dev and self._dev.point_id else f"point_{self._idx:03d}"
-        return f"{self._entry_id}_battery_{base}"
-
-    @property
-    def name(self) -> str:
-        if self._dev:
-            return f"{self._dev.name} Battery"
-        return f"Point {self._idx:03d} Battery"
+    _uid_key = "battery"
+    _name_suffix = "Battery"
 
     @property
     def native_value(self) -> int | None:
@@ -91,40 +62,27 @@ class PellaBatterySensor(_BaseSensor):
 
 class PellaBridgeIndexSensor(_BaseSensor):
     _attr_entity_category = EntityCategory.DIAGNOSTIC
-
-    @property
-    def unique_id(self) -> str:
-        base = self._dev.point_id if self._dev and self._dev.point_id else f"point_{self._idx:03d}"
-        return f"{self._entry_id}_bridge_index_{base}"
-
-    @property
-    def name(self) -> str:
-        if self._dev:
-            return f"{self._dev.name} Bridge Index"
-        return f"Point {self._idx:03d} Bridge Index"
+    _uid_key = "bridge_index"
+    _name_suffix = "Bridge Index"
 
     @property
     def native_value(self) -> int:
         return int(self._idx)
 
 
-
 class PellaRawStatusSensor(_BaseSensor):
     _attr_entity_category = EntityCategory.DIAGNOSTIC
-
-    @property
-    def unique_id(self) -> str:
-        base = self._dev.point_id if self._dev and self._dev.point_id else f"point_{self._idx:03d}"
-        return f"{self._entry_id}_rawstatus_{base}"
-
-    @property
-    def name(self) -> str:
-        if self._dev:
-            return f"{self._dev.name} Raw Status"
-        return f"Point {self._idx:03d} Raw Status"
+    _uid_key = "rawstatus"
+    _name_suffix = "Raw Status"
 
     @property
     def native_value(self) -> str | None:
         if not self._dev:
             return None
         return self._dev.status_hex
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        attrs = self.coordinator.point_health(self._idx)
+        attrs["stale"] = bool(self._dev and self._dev.stale)
+        return attrs
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+import voluptuous as vol
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError, Unauthorized, UnknownUser
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.service import async_register_admin_service
+
+from .const import (
+    ATTR_COMMANDS,
+    ATTR_CPROFILE,
+    ATTR_DURATION,
+    ATTR_ENTRY_ID,
+    ATTR_KIND,
+    ATTR_POINTS,
+    ATTR_REPLACE,
+    ATTR_SNAPSHOT,
+    ATTR_TIMEOUT,
+    DOMAIN,
+    PROFILE_DEFAULT_SECONDS,
+    PROFILE_FILENAME,
+    PROFILE_MAX_BYTES,
+    PROFILE_MAX_SECONDS,
+    PROFILE_TOP_FUNCTIONS,
+    REFRESH_BOTH,
+    REFRESH_KINDS,
+    SERVICE_EXPORT_SNAPSHOT,
+    SERVICE_IMPORT_SNAPSHOT,
+    SERVICE_QUERY,
+    SERVICE_REFRESH,
+    SERVICE_START_PROFILE,
+    SERVICE_STOP_PROFILE,
+)
+from .coordinator import PellaCoordinator
+from .profiler import Profiler
+from .snapshot import snapshot_from_text, snapshot_to_text
+
+_LOGGER = logging.getLogger(__name__)
+
+# hass.data key for the running (Profiler, cancel timer) pair, if any.
+PROFILE_DATA = f"{DOMAIN}_profile"
+
+REFRESH_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_POINTS): vol.All(cv.ensure_list, [vol.All(vol.Coerce(int), vol.Range(min=1, max=128))]),
+        vol.Optional(ATTR_KIND, default=REFRESH_BOTH): vol.In(REFRESH_KINDS),
+    }
+)
+
+QUERY_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+        vol.Required(ATTR_COMMANDS): vol.All(cv.ensure_list, [cv.string], vol.Length(min=1)),
+        vol.Optional(ATTR_TIMEOUT, default=5.0): vol.All(vol.Coerce(float), vol.Range(min=0.5, max=30)),
+    }
+)
+
+EXPORT_SNAPSHOT_SCHEMA = vol.Schema({vol.Optional(ATTR_ENTRY_ID): cv.string})
+
+IMPORT_SNAPSHOT_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+        vol.Required(ATTR_SNAPSHOT): cv.string,
+        vol.Optional(ATTR_REPLACE, default=False): cv.boolean,
+    }
+)
+
+START_PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_DURATION, default=PROFILE_DEFAULT_SECONDS): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=PROFILE_MAX_SECONDS)
+        ),
+        vol.Optional(ATTR_CPROFILE, default=False): cv.boolean,
+    }
+)
+
+
+def _coordinators(hass: HomeAssistant, call: ServiceCall) -> list[PellaCoordinator]:
+    coords: dict[str, PellaCoordinator] = hass.data.get(DOMAIN, {})
+    entry_id = call.data.get(ATTR_ENTRY_ID)
+    if entry_id is None:
+        return list(coords.values())
+    coord = coords.get(entry_id)
+    if coord is None:
+        raise HomeAssistantError(f"No loaded Pella Insynctive bridge with entry_id {entry_id}")
+    return [coord]
+
+
+def _single_coordinator(hass: HomeAssistant, call: ServiceCall) -> PellaCoordinator:
+    coords = _coordinators(hass, call)
+    if len(coords) != 1:
+        raise HomeAssistantError("Specify entry_id when more than one bridge is loaded")
+    return coords[0]
+
+
+def _admin_only(hass: HomeAssistant, handler: Callable[[ServiceCall], Awaitable[ServiceResponse]]):
+    """Wrap a handler that returns a response with the admin check of
+    async_register_admin_service, which drops service responses."""
+
+    async def _handle(call: ServiceCall) -> ServiceResponse:
+        if call.context.user_id:
+            user = await hass.auth.async_get_user(call.context.user_id)
+            if user is None:
+                raise UnknownUser(context=call.context)
+            if not user.is_admin:
+                raise Unauthorized(context=call.context)
+        return await handler(call)
+
+    return _handle
+
+
+def _async_start_profile(hass: HomeAssistant, coords: list[PellaCoordinator], duration: int, use_cprofile: bool) -> None:
+    if PROFILE_DATA in hass.data:
+        raise HomeAssistantError("A Pella Insynctive profile is already running")
+    profiler = Profiler(use_cprofile)
+    for coord in coords:
+        profiler.instrument(coord, coord.entry.entry_id, coord.PROFILE_TARGETS)
+
+    async def _expired(_now) -> None:
+        await _async_stop_profile(hass)
+
+    cancel: CALLBACK_TYPE = async_call_later(hass, duration, _expired)
+    hass.data[PROFILE_DATA] = (profiler, cancel)
+    _LOGGER.info("Profiling %s bridge(s) for up to %ss (cprofile=%s)", len(coords), duration, use_cprofile)
+
+
+async def _async_stop_profile(hass: HomeAssistant) -> str | None:
+    """Stop the running profile, if any, and return the report path."""
+    running = hass.data.pop(PROFILE_DATA, None)
+    if running is None:
+        return None
+    profiler, cancel = running
+    cancel()
+    profiler.restore()
+
+    report = profiler.report(PROFILE_MAX_BYTES, PROFILE_TOP_FUNCTIONS)
+    path = hass.config.path(PROFILE_FILENAME.format(stamp=time.strftime("%Y%m%d_%H%M%S")))
+
+    def _write() -> None:
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.write(report)
+
+    await hass.async_add_executor_job(_write)
+    _LOGGER.info("Profile written to %s", path)
+    return path
+
+
+async def async_setup_services(hass: HomeAssistant) -> None:
+    if hass.services.has_service(DOMAIN, SERVICE_REFRESH):
+        return
+
+    async def _handle_refresh(call: ServiceCall) -> None:
+        points = call.data.get(ATTR_POINTS)
+        kind = call.data[ATTR_KIND]
+        for coord in _coordinators(hass, call):
+            await coord.async_refresh(points, kind)
+
+    async def _handle_query(call: ServiceCall) -> ServiceResponse:
+        responses = await _single_coordinator(hass, call).async_query_batch(call.data[ATTR_COMMANDS], timeout=call.data[ATTR_TIMEOUT])
+        return {"responses": responses}
+
+    async def _handle_export_snapshot(call: ServiceCall) -> ServiceResponse:
+        coord = _single_coordinator(hass, call)
+        data = coord.export_snapshot()
+        return {"snapshot": snapshot_to_text(data), "points": len(coord.data), "bytes": len(data)}
+
+    async def _handle_import_snapshot(call: ServiceCall) -> ServiceResponse:
+        coord = _single_coordinator(hass, call)
+        try:
+            written = coord.async_import_snapshot(snapshot_from_text(call.data[ATTR_SNAPSHOT]), call.data[ATTR_REPLACE])
+        except ValueError as err:
+            raise HomeAssistantError(str(err)) from err
+        return {"points": written}
+
+    async def _handle_start_profile(call: ServiceCall) -> None:
+        _async_start_profile(hass, _coordinators(hass, call), call.data[ATTR_DURATION], call.data[ATTR_CPROFILE])
+
+    async def _handle_stop_profile(call: ServiceCall) -> ServiceResponse:
+        path = await _async_stop_profile(hass)
+        if path is None:
+            raise HomeAssistantError("No Pella Insynctive profile is running")
+        return {"path": path}
+
+    hass.services.async_register(DOMAIN, SERVICE_REFRESH, _handle_refresh, schema=REFRESH_SCHEMA)
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_QUERY,
+        _handle_query,
+        schema=QUERY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    # Profiling patches coordinator methods and writes files under the config dir.
+    async_register_admin_service(
+        hass, DOMAIN, SERVICE_START_PROFILE, _handle_start_profile, schema=START_PROFILE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_STOP_PROFILE,
+        _admin_only(hass, _handle_stop_profile),
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_SNAPSHOT,
+        _handle_export_snapshot,
+        schema=EXPORT_SNAPSHOT_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_SNAPSHOT,
+        _admin_only(hass, _handle_import_snapshot),
+        schema=IMPORT_SNAPSHOT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import zlib
+from dataclasses import dataclass, field
+
+# Format: MAGIC + version byte + zlib(packed JSON). Points are positional rows
+# in POINT_FIELDS order so hundreds of points stay a few kB.
+SNAPSHOT_MAGIC = b"PIS"
+SNAPSHOT_VERSION = 1
+POINT_FIELDS = ("index", "point_id", "device_type", "name", "status_hex", "battery_hex")
+
+
+@dataclass
+class Snapshot:
+    bridge_id: str
+    points: list[dict] = field(default_factory=list)
+    # {"name": {idx: str}, "area": {idx: str}}
+    overrides: dict[str, dict[int, str]] = field(default_factory=dict)
+
+
+def encode_snapshot(snap: Snapshot) -> bytes:
+    payload = {
+        "bridge": snap.bridge_id,
+        "points": [[p.get(f) for f in POINT_FIELDS] for p in snap.points],
+        "overrides": {kind: {str(i): v for i, v in vals.items()} for kind, vals in snap.overrides.items() if vals},
+    }
+    packed = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return SNAPSHOT_MAGIC + bytes([SNAPSHOT_VERSION]) + zlib.compress(packed, 9)
+
+
+def decode_snapshot(data: bytes) -> Snapshot:
+    """Raises ValueError if data isn't a snapshot this version understands."""
+    if not data.startswith(SNAPSHOT_MAGIC) or len(data) <= len(SNAPSHOT_MAGIC):
+        raise ValueError("Not a Pella Insynctive snapshot")
+    version = data[len(SNAPSHOT_MAGIC)]
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot version {version}")
+    try:
+        payload = json.loads(zlib.decompress(data[len(SNAPSHOT_MAGIC) + 1 :]))
+        points = [dict(zip(POINT_FIELDS, row, strict=True)) for row in payload["points"]]
+        overrides = {
+            kind: {int(i): str(v) for i, v in vals.items()} for kind, vals in payload.get("overrides", {}).items()
+        }
+        return Snapshot(str(payload["bridge"]), points, overrides)
+    except (zlib.error, KeyError, TypeError, ValueError) as err:
+        raise ValueError(f"Corrupt snapshot: {err}") from err
+
+
+def snapshot_to_text(data: bytes) -> str:
+    return base64.b64encode(data).decode("ascii")
+
+
+def snapshot_from_text(text: str) -> bytes:
+    try:
+        return base64.b64decode(text, validate=True)
+    except (binascii.Error, ValueError) as err:
+        raise ValueError(f"Snapshot is not valid base64: {err}") from err
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+_LOGGER = logging.getLogger(__name__)
+
+TRACE_HEADER = "# pella_insynctive trace v1"
+DIR_TX = "TX"
+DIR_RX = "RX"
+
+# Buffered lines are written out in one executor job once either limit is hit.
+FLUSH_LINES = 64
+FLUSH_SECONDS = 1.0
+
+
+@dataclass
+class TraceRecord:
+    offset: float
+    direction: str
+    line: str
+
+
+class TraceRecorder:
+    """Append timestamped TX/RX lines to a size-bounded, rotating file.
+
+    Each line is "<seconds since start> <TX|RX> <text>". Writes are batched
+    and done in the default executor so the event loop never blocks on disk.
+    When the file exceeds max_bytes it is rotated to .1, .2, ... up to backups.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 1_000_000, backups: int = 2) -> None:
+        self._path = path
+        self._max_bytes = max_bytes
+        self._backups = backups
+        self._t0 = time.monotonic()
+        self._buf: list[str] = []
+        self._last_flush = self._t0
+        self._flushing: asyncio.Future | None = None
+        self._buf.append(f"{TRACE_HEADER} {datetime.now(timezone.utc).isoformat()}\n")
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def record(self, direction: str, line: str) -> None:
+        now = time.monotonic()
+        self._buf.append(f"{now - self._t0:.4f} {direction} {line}\n")
+        if len(self._buf) >= FLUSH_LINES or now - self._last_flush >= FLUSH_SECONDS:
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if self._flushing is not None and not self._flushing.done():
+            return
+        chunk, self._buf = self._buf, []
+        self._last_flush = time.monotonic()
+        self._flushing = asyncio.get_running_loop().run_in_executor(None, self._write, chunk)
+
+    async def aclose(self) -> None:
+        if self._flushing is not None:
+            await self._flushing
+        if self._buf:
+            chunk, self._buf = self._buf, []
+            await asyncio.get_running_loop().run_in_executor(None, self._write, chunk)
+
+    def _write(self, chunk: list[str]) -> None:
+        try:
+            if os.path.exists(self._path) and os.path.getsize(self._path) >= self._max_bytes:
+                self._rotate()
+            with open(self._path, "a", encoding="utf-8") as fh:
+                fh.writelines(chunk)
+        except OSError as err:
+            _LOGGER.debug("Trace write to %s failed: %s", self._path, err)
+
+    def _rotate(self) -> None:
+        for n in range(self._backups, 0, -1):
+            src = self._path if n == 1 else f"{self._path}.{n - 1}"
+            if os.path.exists(src):
+                os.replace(src, f"{self._path}.{n}")
+        if self._backups == 0:
+            os.remove(self._path)
+
+
+def load_trace(path: str) -> list[TraceRecord]:
+    """Read a capture written by TraceRecorder. Blocking; use an executor."""
+    records: list[TraceRecord] = []
+    with open(path, encoding="utf-8") as fh:
+        for raw in fh:
+            if raw.startswith("#"):
+                continue
+            parts = raw.rstrip("\r\n").split(" ", 2)
+            if len(parts) < 3 or parts[1] not in (DIR_TX, DIR_RX):
+                continue
+            try:
+                offset = float(parts[0])
+            except ValueError:
+                continue
+            records.append(TraceRecord(offset, parts[1], parts[2]))
+    return records
+
+
+class TraceReplayClient:
+    """Stand-in for TelnetClient that is driven by a capture.
+
+    It never touches the network: send() just records what the coordinator
+    transmitted so the replay driver can check it against the capture.
+    """
+
+    def __init__(self) -> None:
+        self.sent: list[str] = []
+        self._sent_event = asyncio.Event()
+
+    @property
+    def is_connected(self) -> bool:
+        return True
+
+    async def wait_connected(self, timeout: float) -> bool:
+        return True
+
+    def note_reply_ok(self) -> None:
+        return None
+
+    def note_reply_error(self) -> None:
+        return None
+
+    async def start(self) -> None:
+        return None
+
+    async def stop(self) -> None:
+        return None
+
+    async def send(self, command: str) -> None:
+        line = command.strip()
+        if not line:
+            return
+        self.sent.append(line)
+        self._sent_event.set()
+
+    async def wait_sent(self, count: int, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        while len(self.sent) < count:
+            self._sent_event.clear()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            try:
+                await asyncio.wait_for(self._sent_event.wait(), timeout=remaining)
+            except TimeoutError:
+                return False
+        return True
+
+
+@dataclass
+class ReplayStats:
+    rx_lines: int = 0
+    queries: int = 0
+    answered: int = 0
+    timeouts: int = 0
+    mismatched_tx: int = 0
+    duration_s: float = 0.0
+
+
+async def async_replay(
+    records: list[TraceRecord],
+    on_line: Callable[[str], Awaitable[None]],
+    query: Callable[[str], Awaitable[str]],
+    client: TraceReplayClient,
+    speed: float = 1.0,
+) -> ReplayStats:
+    """Feed a capture back through a coordinator.
+
+    RX lines go to on_line (normally PellaCoordinator._handle_line) and "?"
+    TX lines are re-issued through query (normally PellaCoordinator._query),
+    whose send lands on client. Records are released at their original
+    offsets divided by speed; speed <= 0 replays as fast as possible while
+    keeping the captured ordering.
+    """
+    stats = ReplayStats()
+    started = time.monotonic()
+    base = records[0].offset if records else 0.0
+    inflight: list[asyncio.Task] = []
+    last_query: str | None = None
+
+    async def _run_query(cmd: str) -> None:
+        try:
+            await query(cmd)
+            stats.answered += 1
+        except TimeoutError:
+            stats.timeouts += 1
+
+    for rec in records:
+        if speed > 0:
+            due = started + (rec.offset - base) / speed
+            delay = due - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        if rec.direction == DIR_RX:
+            stats.rx_lines += 1
+            await on_line(rec.line)
+            continue
+
+        if not rec.line.startswith("?"):
+            await client.send(rec.line)
+            continue
+
+        # Re-issue the query and wait until it has actually been transmitted,
+        # so the reply that follows in the capture resolves it. A repeat of a
+        # still-pending query is the coordinator's own retry, not a new query.
+        expected = len(client.sent) + 1
+        is_retry = bool(inflight) and not inflight[-1].done() and last_query == rec.line
+        if not is_retry:
+            stats.queries += 1
+            last_query = rec.line
+            inflight.append(asyncio.create_task(_run_query(rec.line)))
+        if not await client.wait_sent(expected, timeout=30.0):
+            stats.mismatched_tx += 1
+        elif client.sent[expected - 1] != rec.line.strip():
+            stats.mismatched_tx += 1
+
+    if inflight:
+        await asyncio.gather(*inflight)
+    stats.duration_s = round(time.monotonic() - started, 3)
+    return stats
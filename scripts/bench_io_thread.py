@@ -0,0 +1,152 @@
+"""I/O thread benchmark: main-loop CPU time per 1,000 bridge events, per mode.
+
+Runs the integration in a real HA core against the fake bridge from soak.py,
+once on the main loop and once with --io-thread, and floods it with
+unsolicited POINTSTATUS lines. The bridge runs on a loop of its own in
+another thread, so the main thread's CPU time (time.thread_time) is the
+integration's and HA's work: socket reads, decoding and applying in the
+default mode, only applying the decoded batches with the I/O thread. The
+idle rate measured just before each flood is subtracted.
+
+The coordinator's _publish_batch (apply the batch, one coordinator update and
+the entity state writes) runs on the main loop in both modes, so its share is
+timed separately; "other" is everything else: socket reads, decoding and RX
+dispatch.
+
+    python scripts/bench_io_thread.py [--events 10000] [--points 24]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import threading
+import time
+
+from soak import DOMAIN, FakeBridge, async_add_entry, async_make_hass, async_wait_discovered
+
+# Below the client's RX queue size, so a burst is not dropped.
+BURST = 200
+BURST_INTERVAL_S = 0.01
+IDLE_WINDOW_S = 1.0
+
+
+class BridgeThread:
+    """A FakeBridge served from its own event loop and thread."""
+
+    def __init__(self, bridge: FakeBridge) -> None:
+        self.bridge = bridge
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="fake_bridge", daemon=True)
+        self._server: asyncio.AbstractServer | None = None
+
+    async def start(self) -> int:
+        self._thread.start()
+        self._server = await self._run(asyncio.start_server(self.bridge.handle, "127.0.0.1", 0))
+        return self._server.sockets[0].getsockname()[1]
+
+    async def _run(self, coro):
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self.loop))
+
+    def flood(self, lines: int) -> None:
+        self.loop.call_soon_threadsafe(self.bridge.flood, lines)
+
+    async def stop(self) -> None:
+        async def _close() -> None:
+            assert self._server is not None
+            self._server.close()
+            self.bridge.drop()
+            await self._server.wait_closed()
+
+        await self._run(_close())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(5)
+        self.loop.close()
+
+
+async def async_measure(args: argparse.Namespace, io_thread: bool) -> dict:
+    bridge = BridgeThread(FakeBridge(args.points))
+    port = await bridge.start()
+    options = {
+        "poll_interval_seconds": 0,
+        "battery_poll_minutes": 0,
+        "send_rate_max": 0,
+        "io_thread": io_thread,
+    }
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await async_make_hass(config_dir)
+        entry = await async_add_entry(hass, port, options)
+        await async_wait_discovered(hass, entry)
+        coord = hass.data[DOMAIN][entry.entry_id]
+        client = coord.client
+        publish_s = 0.0
+        publish_batch = coord._publish_batch
+
+        def _timed_publish(batch, t_dispatch) -> None:
+            nonlocal publish_s
+            started = time.thread_time()
+            try:
+                publish_batch(batch, t_dispatch)
+            finally:
+                publish_s += time.thread_time() - started
+
+        coord._publish_batch = _timed_publish
+        await asyncio.sleep(IDLE_WINDOW_S)
+
+        cpu, wall = time.thread_time(), time.perf_counter()
+        await asyncio.sleep(IDLE_WINDOW_S)
+        idle_rate = (time.thread_time() - cpu) / (time.perf_counter() - wall)
+
+        def _received() -> int:
+            stats = client.rx_stats
+            return stats["lines"] + stats["overflow_dropped"]
+
+        received, dropped = _received(), client.rx_stats["overflow_dropped"]
+        batches = client.rx_stats["batches"]
+        publish_s = 0.0
+        cpu, wall = time.thread_time(), time.perf_counter()
+        for _ in range(args.events // BURST):
+            bridge.flood(BURST)
+            await asyncio.sleep(BURST_INTERVAL_S)
+        while _received() - received < args.events:
+            await asyncio.sleep(0.01)
+        await hass.async_block_till_done()
+        busy = (time.thread_time() - cpu) - idle_rate * (time.perf_counter() - wall)
+        dropped = client.rx_stats["overflow_dropped"] - dropped
+        batches = client.rx_stats["batches"] - batches
+
+        await hass.async_stop(force=True)
+    await bridge.stop()
+    per_1000_ms = 1000 * 1000 / args.events
+    return {
+        "mode": "io_thread" if io_thread else "main_loop",
+        "events": args.events,
+        "batches": batches,
+        "rx_dropped": dropped,
+        "main_loop_ms_per_1000": round(busy * per_1000_ms, 2),
+        "publish_ms_per_1000": round(publish_s * per_1000_ms, 2),
+        "other_ms_per_1000": round((busy - publish_s) * per_1000_ms, 2),
+    }
+
+
+async def async_bench(args: argparse.Namespace) -> list[dict]:
+    results = []
+    for io_thread in (False, True):
+        results.append(await async_measure(args, io_thread))
+        print(results[-1], flush=True)
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=10_000, help="rounded down to a multiple of %d" % BURST)
+    parser.add_argument("--points", type=int, default=24)
+    args = parser.parse_args()
+    args.events -= args.events % BURST
+    asyncio.run(async_bench(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
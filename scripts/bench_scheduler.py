@@ -0,0 +1,113 @@
+"""Multi-bridge benchmark: worst main-loop stall with and without the scheduler.
+
+Simulates `--bridges` bridges of `--points` points. Each sweep queries every
+point in turn (a query is a --query-ms round trip) and then fans the result
+out, which costs --fanout-ms of CPU on the loop. Every bridge's sweep starts
+on the same tick, the worst case the phase offsets are there to avoid.
+
+Without the scheduler the sweeps finish together and their fan-outs run
+back to back. With it, sweeps and queries go through the real SweepScheduler
+budgets and publishes, so at most one fan-out runs per loop iteration. A
+monitor task reports how late its 1 ms ticks ran.
+
+    python scripts/bench_scheduler.py [--bridges 4 8] [--points 128] [--rounds 3]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import sys
+import tempfile
+import time
+
+from homeassistant.core import HomeAssistant
+from soak import _mount_integration
+
+TICK_S = 0.001
+
+
+def _fanout(cpu_s: float) -> None:
+    end = time.perf_counter() + cpu_s
+    while time.perf_counter() < end:
+        pass
+
+
+async def _monitor(stop: asyncio.Event) -> float:
+    """Worst delay, in seconds, of a TICK_S sleep until stop is set."""
+    worst = 0.0
+    last = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(TICK_S)
+        now = time.perf_counter()
+        worst = max(worst, now - last - TICK_S)
+        last = now
+    return worst
+
+
+async def async_round(args: argparse.Namespace, bridges: int, scheduler) -> tuple[float, float]:
+    """One sweep on every bridge; returns (worst stall, wall time) in seconds."""
+    query_s, fanout_s = args.query_ms / 1000, args.fanout_ms / 1000
+
+    async def _sweep(entry_id: str) -> None:
+        sweep = scheduler.sweep(entry_id) if scheduler else contextlib.nullcontext()
+        async with sweep:
+            for _ in range(args.points):
+                query = scheduler.query(entry_id) if scheduler else contextlib.nullcontext()
+                async with query:
+                    await asyncio.sleep(query_s)
+        if scheduler:
+            await scheduler.async_publish(entry_id, lambda: _fanout(fanout_s))
+        else:
+            _fanout(fanout_s)
+
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(_monitor(stop))
+    await asyncio.sleep(TICK_S * 5)
+    started = time.perf_counter()
+    await asyncio.gather(*(_sweep(f"bridge{i}") for i in range(bridges)))
+    wall = time.perf_counter() - started
+    stop.set()
+    return await monitor, wall
+
+
+async def async_bench(args: argparse.Namespace) -> list[dict]:
+    _mount_integration()
+    from custom_components.pella_insynctive.scheduler import SweepScheduler
+
+    results = []
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        for bridges in args.bridges:
+            for mode in ("unscheduled", "scheduled"):
+                scheduler = SweepScheduler(hass) if mode == "scheduled" else None
+                if scheduler:
+                    for i in range(bridges):
+                        scheduler.register(f"bridge{i}")
+                rounds = [await async_round(args, bridges, scheduler) for _ in range(args.rounds)]
+                result = {
+                    "bridges": bridges,
+                    "mode": mode,
+                    "worst_stall_ms": round(max(stall for stall, _ in rounds) * 1000, 1),
+                    "sweep_wall_ms": round(max(wall for _, wall in rounds) * 1000),
+                }
+                if scheduler:
+                    result["fairness"] = scheduler.fairness()["query_wait_jain"]
+                results.append(result)
+                print(result, flush=True)
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bridges", type=int, nargs="+", default=[4, 8])
+    parser.add_argument("--points", type=int, default=128)
+    parser.add_argument("--query-ms", type=float, default=2.0)
+    parser.add_argument("--fanout-ms", type=float, default=15.0)
+    parser.add_argument("--rounds", type=int, default=3)
+    asyncio.run(async_bench(parser.parse_args()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
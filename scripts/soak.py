@@ -0,0 +1,298 @@
+"""Soak/leak harness: run the integration in a real HA core against a fake bridge.
+
+Each cycle floods unsolicited POINTSTATUS lines, drops the bridge connection,
+floods again and then unloads/re-sets up the config entry. After every cycle
+it prints tracemalloc totals, asyncio task and thread counts, coordinator
+listeners, the entry's entities and any per-entry keys left in hass.data, and
+at the end it fails if any of them kept growing or entities were duplicated.
+
+    python scripts/soak.py --cycles 10 [--points 24] [--io-thread] [--push-first]
+
+--push-first makes the bridge push a POINTSTATUS line for every point before
+answering any query, so points are first seen by index and only later
+resolved by discovery.
+
+Needs homeassistant installed; the integration is linked into a temporary
+directory and mounted as a custom component.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import atexit
+import gc
+import importlib
+import logging
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+from homeassistant import config_entries, loader
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import area_registry as ar
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity as entity_helper
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers import issue_registry as ir
+from homeassistant.helpers import restore_state, translation
+from homeassistant.setup import async_setup_component
+
+DOMAIN = "pella_insynctive"
+INTEGRATION_DIR = Path(__file__).resolve().parent.parent / DOMAIN
+
+# Device types cycled over the fake bridge's points: contact, garage, lock, shade.
+POINT_TYPES = (0x01, 0x03, 0x0D, 0x13)
+# Entities each point should end up with, by device type (sensors 3, buttons 2, + type platform).
+ENTITIES_PER_POINT = {0x01: 7, 0x03: 7, 0x0D: 7, 0x13: 6}
+BRIDGE_ENTITIES = 3
+
+# Allowed growth between the second and last cycle before the run is failed.
+MAX_TASK_GROWTH = 2
+MAX_MEM_GROWTH_PER_CYCLE = 64 * 1024
+
+
+class FakeBridge:
+    """Answers the bridge's telnet line protocol for `points` paired points.
+
+    Set commands ("!...") are echoed and then answered with set_reply, or
+    only echoed when it is None. Every command received is kept in `received`.
+    """
+
+    def __init__(self, points: int, push_first: bool = False, set_reply: str | None = "OK") -> None:
+        self.points = points
+        self.push_first = push_first
+        self.set_reply = set_reply
+        self.writers: set[asyncio.StreamWriter] = set()
+        self.received: list[str] = []
+
+    def device_type(self, idx: int) -> int:
+        return POINT_TYPES[(idx - 1) % len(POINT_TYPES)] if 1 <= idx <= self.points else 0x00
+
+    def expected_entities(self) -> int:
+        return BRIDGE_ENTITIES + sum(ENTITIES_PER_POINT[self.device_type(i)] for i in range(1, self.points + 1))
+
+    def _reply(self, cmd: str) -> str | None:
+        if cmd.startswith("!"):
+            return self.set_reply
+        if cmd == "?POINTCOUNT":
+            return f"{self.points:03d}"
+        if cmd.startswith("?POINTDEVICE-"):
+            return f"${self.device_type(int(cmd[-3:])):02X}"
+        if cmd.startswith("?POINTID-"):
+            return f"S{0x98A000 + int(cmd[-3:]):06X}"
+        if cmd.startswith("?POINTSTATUS-"):
+            return f"$0{random.randint(0, 2)}"
+        if cmd.startswith("?POINTBATTERYGET-"):
+            return "$5A"
+        return "OK"
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.writers.add(writer)
+        try:
+            if self.push_first:
+                for idx in range(1, self.points + 1):
+                    writer.write(f"POINTSTATUS-{idx:03d},$01\r\n".encode())
+                await writer.drain()
+            while raw := await reader.readline():
+                cmd = raw.decode().strip()
+                self.received.append(cmd)
+                # The real bridge echoes each command before answering.
+                writer.write(f"{cmd}\r\n".encode())
+                if (reply := self._reply(cmd)) is not None:
+                    writer.write(f"{reply}\r\n".encode())
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.writers.discard(writer)
+            writer.close()
+
+    def flood(self, lines: int) -> None:
+        for writer in list(self.writers):
+            for _ in range(lines):
+                idx = random.randint(1, self.points)
+                writer.write(f"POINTSTATUS-{idx:03d},$0{random.randint(0, 2)}\r\n".encode())
+
+    def drop(self) -> None:
+        for writer in list(self.writers):
+            writer.close()
+
+
+def _mount_integration() -> None:
+    """Make the integration importable as custom_components.pella_insynctive.
+
+    HA imports custom_components once per process, so it is mounted once from
+    a directory of its own rather than from each run's config dir.
+    """
+    if "custom_components" in sys.modules:
+        return
+    root = Path(tempfile.mkdtemp(prefix="pella_insynctive_"))
+    atexit.register(shutil.rmtree, root, ignore_errors=True)
+    components = root / "custom_components"
+    components.mkdir()
+    (components / "__init__.py").touch()
+    (components / DOMAIN).symlink_to(INTEGRATION_DIR)
+    sys.path.insert(0, str(root))
+    try:
+        importlib.import_module("custom_components")
+    finally:
+        sys.path.remove(str(root))
+
+
+async def async_make_hass(config_dir: str) -> HomeAssistant:
+    """Bring up a minimal HA core with the integration as a custom component."""
+    _mount_integration()
+    hass = HomeAssistant(config_dir)
+    hass.config.skip_pip = True
+    loader.async_setup(hass)
+    translation.async_setup(hass)
+    entity_helper.async_setup(hass)
+    await ar.async_load(hass)
+    await dr.async_load(hass)
+    await er.async_load(hass)
+    await ir.async_load(hass)
+    await restore_state.async_load(hass)
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await hass.config_entries.async_initialize()
+    await hass.async_start()
+    assert await async_setup_component(hass, DOMAIN, {})
+    return hass
+
+
+async def async_add_entry(hass: HomeAssistant, port: int, options: dict) -> config_entries.ConfigEntry:
+    entry = config_entries.ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=DOMAIN,
+        title="soak",
+        data={"host": "127.0.0.1", "port": port},
+        source="user",
+        options=options,
+    )
+    await hass.config_entries.async_add(entry)
+    await hass.async_block_till_done()
+    return entry
+
+
+async def async_wait_discovered(hass: HomeAssistant, entry: config_entries.ConfigEntry, timeout: float = 10) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        coord = hass.data[DOMAIN].get(entry.entry_id)
+        if coord is not None and coord.startup_timings["all_entities_s"] is not None:
+            break
+        await asyncio.sleep(0.05)
+    await hass.async_block_till_done()
+
+
+def entry_entities(hass: HomeAssistant, entry: config_entries.ConfigEntry) -> list[str]:
+    return [ent.entity_id for ent in er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)]
+
+
+def sample(hass: HomeAssistant, entry: config_entries.ConfigEntry) -> dict:
+    gc.collect()
+    coord = hass.data[DOMAIN].get(entry.entry_id)
+    return {
+        "mem": sum(stat.size for stat in tracemalloc.take_snapshot().statistics("filename")),
+        "tasks": len(asyncio.all_tasks()),
+        "threads": threading.active_count(),
+        "listeners": (len(coord._listeners), len(coord._point_listeners)) if coord else None,
+        "entities": len(entry_entities(hass, entry)),
+        "states": sum(1 for entity_id in entry_entities(hass, entry) if hass.states.get(entity_id)),
+        "data_keys": sorted(str(key) for key in hass.data if str(key).startswith(f"{DOMAIN}_") and entry.entry_id in str(key)),
+    }
+
+
+async def async_soak(args: argparse.Namespace) -> list[str]:
+    bridge = FakeBridge(args.points, push_first=args.push_first)
+    server = await asyncio.start_server(bridge.handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    options = {
+        "poll_interval_seconds": 0,
+        "battery_poll_minutes": 0,
+        "reconnect_min_seconds": 1,
+        "reconnect_max_seconds": 1,
+        "send_rate_max": 0,
+        "io_thread": args.io_thread,
+    }
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await async_make_hass(config_dir)
+        entry = await async_add_entry(hass, port, options)
+        await async_wait_discovered(hass, entry)
+        tracemalloc.start(10)
+
+        samples = []
+        for cycle in range(args.cycles):
+            for _ in range(20):
+                bridge.flood(50)
+                await asyncio.sleep(0.02)
+            bridge.drop()
+            await asyncio.sleep(1.5)
+            for _ in range(10):
+                bridge.flood(50)
+                await asyncio.sleep(0.02)
+
+            started = time.monotonic()
+            assert await hass.config_entries.async_unload(entry.entry_id)
+            unload_s = time.monotonic() - started
+            assert await hass.config_entries.async_setup(entry.entry_id)
+            await async_wait_discovered(hass, entry)
+            samples.append(sample(hass, entry))
+            print(f"cycle {cycle}: unload {unload_s * 1000:.0f}ms", samples[-1], flush=True)
+
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_stop(force=True)
+        tracemalloc.stop()
+    server.close()
+    bridge.drop()
+    await server.wait_closed()
+
+    return check(samples, bridge.expected_entities())
+
+
+def check(samples: list[dict], expected_entities: int) -> list[str]:
+    errors = []
+    for i, s in enumerate(samples):
+        if s["entities"] != expected_entities or s["states"] != expected_entities:
+            errors.append(f"cycle {i}: {s['entities']} entities ({s['states']} with state), expected {expected_entities}")
+        if s["data_keys"]:
+            errors.append(f"cycle {i}: per-entry keys left in hass.data: {s['data_keys']}")
+    if len(samples) >= 3:
+        # The first cycle still warms caches; compare from the second on.
+        first, last = samples[1], samples[-1]
+        if last["tasks"] - first["tasks"] > MAX_TASK_GROWTH:
+            errors.append(f"tasks grew from {first['tasks']} to {last['tasks']}")
+        if last["threads"] > first["threads"]:
+            errors.append(f"threads grew from {first['threads']} to {last['threads']}")
+        if last["listeners"] != first["listeners"]:
+            errors.append(f"coordinator listeners changed from {first['listeners']} to {last['listeners']}")
+        per_cycle = (last["mem"] - first["mem"]) / (len(samples) - 2)
+        if per_cycle > MAX_MEM_GROWTH_PER_CYCLE:
+            errors.append(f"traced memory grew {per_cycle / 1024:.0f} kB per cycle")
+    return errors
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cycles", type=int, default=10)
+    parser.add_argument("--points", type=int, default=24)
+    parser.add_argument("--io-thread", action="store_true", help="run the bridge transport on the I/O thread")
+    parser.add_argument("--push-first", action="store_true", help="push every point's status before discovery")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    errors = asyncio.run(async_soak(args))
+    for error in errors:
+        print("FAIL:", error)
+    if not errors:
+        print("OK")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
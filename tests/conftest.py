@@ -0,0 +1,6 @@
+"""Tests run the integration in a real HA core; the fake bridge and HA setup
+are shared with the scripts in scripts/."""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
@@ -0,0 +1,58 @@
+"""Services that patch code or write files are limited to admin users."""
+from __future__ import annotations
+
+import asyncio
+import tempfile
+
+import pytest
+from homeassistant import auth
+from homeassistant.core import Context
+from homeassistant.exceptions import HomeAssistantError, Unauthorized
+from soak import DOMAIN, FakeBridge, async_add_entry, async_make_hass, async_wait_discovered
+
+OPTIONS = {"poll_interval_seconds": 0, "battery_poll_minutes": 0, "send_rate_max": 0}
+ADMIN_SERVICES = [
+    ("start_profile", {"duration": 60}, False),
+    ("stop_profile", {}, True),
+    ("import_snapshot", {"snapshot": "not a snapshot"}, True),
+]
+
+
+def _call_as(group: str) -> list[str]:
+    """Call each admin service as a user of `group`; returns the outcomes."""
+    bridge = FakeBridge(2)
+
+    async def _main() -> list[str]:
+        server = await asyncio.start_server(bridge.handle, "127.0.0.1", 0)
+        outcomes = []
+        with tempfile.TemporaryDirectory() as config_dir:
+            hass = await async_make_hass(config_dir)
+            hass.auth = await auth.auth_manager_from_config(hass, [], [])
+            await hass.auth.async_create_user("owner")  # the first user is made owner
+            user = await hass.auth.async_create_user("someone", group_ids=[group])
+            entry = await async_add_entry(hass, server.sockets[0].getsockname()[1], OPTIONS)
+            await async_wait_discovered(hass, entry)
+            for service, data, response in ADMIN_SERVICES:
+                try:
+                    await hass.services.async_call(
+                        DOMAIN, service, data, blocking=True, context=Context(user_id=user.id), return_response=response
+                    )
+                except Unauthorized:
+                    outcomes.append("denied")
+                except HomeAssistantError:
+                    # Past the admin check; the call itself failed.
+                    outcomes.append("allowed")
+                else:
+                    outcomes.append("allowed")
+            await hass.async_stop(force=True)
+        server.close()
+        bridge.drop()
+        await server.wait_closed()
+        return outcomes
+
+    return asyncio.run(_main())
+
+
+@pytest.mark.parametrize(("group", "outcome"), [("system-users", "denied"), ("system-admin", "allowed")])
+def test_admin_services_check_user(group: str, outcome: str) -> None:
+    assert _call_as(group) == [outcome] * len(ADMIN_SERVICES)
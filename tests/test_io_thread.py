@@ -0,0 +1,53 @@
+"""Stopping the I/O thread settles every call still waiting on it."""
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import pytest
+from soak import _mount_integration
+
+
+def test_stop_fails_pending_sends(caplog: pytest.LogCaptureFixture) -> None:
+    _mount_integration()
+    from custom_components.pella_insynctive.client import TelnetClientConfig
+    from custom_components.pella_insynctive.io_thread import ThreadedTelnetClient
+
+    async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        while await reader.readline():
+            pass
+        writer.close()
+
+    async def _main() -> tuple[list, float]:
+        server = await asyncio.start_server(_handle, "127.0.0.1", 0)
+        cfg = TelnetClientConfig(
+            host="127.0.0.1",
+            port=server.sockets[0].getsockname()[1],
+            send_rate_max=1,
+            send_rate_min=1,
+            send_rate_start_fraction=1,
+            send_burst=1,
+        )
+        client = ThreadedTelnetClient(cfg, lambda line: None, lambda batch: None, asyncio.get_running_loop())
+        await client.start()
+        assert await client.wait_connected(5)
+        sends = [asyncio.create_task(client.send(f"!POINTSET-00{i},$10")) for i in range(1, 4)]
+        await asyncio.sleep(0.1)
+
+        started = asyncio.get_running_loop().time()
+        await asyncio.wait_for(client.stop(), 5)
+        results = await asyncio.wait_for(asyncio.gather(*sends, return_exceptions=True), 1)
+        elapsed = asyncio.get_running_loop().time() - started
+        with pytest.raises(ConnectionError):
+            await client._call(asyncio.sleep(0))
+        server.close()
+        await server.wait_closed()
+        return results, elapsed
+
+    with caplog.at_level(logging.ERROR):
+        results, elapsed = asyncio.run(_main())
+
+    assert results[0] is None
+    assert all(isinstance(result, ConnectionError) for result in results[1:]), results
+    assert elapsed < 1
+    assert "Task was destroyed" not in caplog.text
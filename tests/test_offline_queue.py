@@ -0,0 +1,47 @@
+"""Queued shade targets flushed on reconnect are not undone by stale ones."""
+from __future__ import annotations
+
+import asyncio
+
+from soak import _mount_integration
+
+
+def test_live_target_is_not_overtaken_by_flush() -> None:
+    _mount_integration()
+    from custom_components.pella_insynctive.client import TelnetClient, TelnetClientConfig
+
+    received: list[str] = []
+
+    async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        while raw := await reader.readline():
+            received.append(raw.decode().strip())
+        writer.close()
+
+    async def _on_lines(lines: list[tuple[str, float]]) -> None:
+        pass
+
+    async def _main() -> None:
+        server = await asyncio.start_server(_handle, "127.0.0.1", 0)
+        cfg = TelnetClientConfig(
+            host="127.0.0.1",
+            port=server.sockets[0].getsockname()[1],
+            send_rate_max=5,
+            send_rate_start_fraction=1,
+            send_burst=1,
+        )
+        client = TelnetClient(cfg, _on_lines)
+        # Queued while offline: point 1's stale target is flushed last.
+        for cmd in ("!POINTSET-002,$10", "!POINTSET-003,$10", "!POINTSET-001,$10"):
+            await client.send(cmd)
+        await client.start()
+        assert await client.wait_connected(5)
+        await asyncio.sleep(0.05)
+        await client.send("!POINTSET-001,$64")
+        await asyncio.sleep(1)
+        await client.stop()
+        server.close()
+        await server.wait_closed()
+
+    asyncio.run(_main())
+    assert [cmd for cmd in received if cmd.startswith("!POINTSET-001")][-1] == "!POINTSET-001,$64"
+    assert sorted(received) == ["!POINTSET-001,$64", "!POINTSET-002,$10", "!POINTSET-003,$10"]
@@ -0,0 +1,49 @@
+"""The config flow probe measures the link, not the empty slots."""
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+from soak import FakeBridge, _mount_integration
+
+PAIRED = (1, 5)
+
+
+class SparseBridge(FakeBridge):
+    """Ten slots with only PAIRED answering; pushes a status before each sample."""
+
+    def _reply(self, cmd: str) -> str | None:
+        if cmd.startswith("?POINTDEVICE-"):
+            return "$01" if int(cmd[-3:]) in PAIRED else None
+        if cmd.startswith("?POINTSTATUS-"):
+            return "POINTSTATUS-007,$02\r\n$01"
+        return super()._reply(cmd)
+
+
+def test_probe_ignores_silent_slots(monkeypatch: pytest.MonkeyPatch) -> None:
+    _mount_integration()
+    from custom_components.pella_insynctive import probe
+
+    monkeypatch.setattr(probe, "PROBE_QUERY_TIMEOUT_SECONDS", 0.2)
+    monkeypatch.setattr(probe, "PROBE_MAX_SECONDS", 1)
+    bridge = SparseBridge(10)
+
+    async def _main() -> probe.ProbeResult:
+        server = await asyncio.start_server(bridge.handle, "127.0.0.1", 0)
+        try:
+            return await probe.async_probe_bridge("127.0.0.1", server.sockets[0].getsockname()[1])
+        finally:
+            server.close()
+            bridge.drop()
+            await server.wait_closed()
+
+    started = time.monotonic()
+    result = asyncio.run(_main())
+    elapsed = time.monotonic() - started
+
+    assert result.point_count == 10
+    assert (result.sent, result.answered, result.drop_rate) == (3, 3, 0.0)
+    assert result.responded
+    assert elapsed < 1.5
+    assert [cmd for cmd in bridge.received if cmd.startswith("?POINTSTATUS")] == ["?POINTSTATUS-001", "?POINTSTATUS-005"]
@@ -0,0 +1,89 @@
+"""Proxy clients share the coordinator's serialized command path."""
+from __future__ import annotations
+
+import asyncio
+import socket
+import tempfile
+
+from soak import DOMAIN, FakeBridge, _mount_integration, async_add_entry, async_make_hass, async_wait_discovered
+
+OPTIONS = {"poll_interval_seconds": 0, "battery_poll_minutes": 0, "send_rate_max": 0}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _ask(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, cmd: str) -> str:
+    writer.write(f"{cmd}\r\n".encode())
+    await writer.drain()
+    return (await asyncio.wait_for(reader.readline(), 5)).decode().strip()
+
+
+def test_set_command_reply_goes_to_sender() -> None:
+    bridge = FakeBridge(4, set_reply="OK")
+    proxy_port = _free_port()
+
+    async def _main() -> tuple[list[str], list[dict]]:
+        server = await asyncio.start_server(bridge.handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        with tempfile.TemporaryDirectory() as config_dir:
+            hass = await async_make_hass(config_dir)
+            entry = await async_add_entry(hass, port, {**OPTIONS, "proxy_port": proxy_port})
+            await async_wait_discovered(hass, entry)
+            reader, writer = await asyncio.open_connection("127.0.0.1", proxy_port)
+
+            async def _downstream() -> list[str]:
+                return [
+                    await _ask(reader, writer, "!POINTSET-001,$10"),
+                    await _ask(reader, writer, "?POINTID-002"),
+                ]
+
+            replies, response = await asyncio.gather(
+                _downstream(),
+                hass.services.async_call(
+                    DOMAIN, "query", {"commands": ["?POINTID-003", "!POINTSET-004,$20"]},
+                    blocking=True, return_response=True,
+                ),
+            )
+            writer.close()
+            await hass.async_stop(force=True)
+        server.close()
+        bridge.drop()
+        await server.wait_closed()
+        return replies, response["responses"]
+
+    replies, results = asyncio.run(_main())
+    assert replies == ["OK", "S98A002"]
+    assert [r["raw"] for r in results] == ["S98A003", "OK"]
+
+
+def test_broadcast_drops_client_that_stops_reading() -> None:
+    _mount_integration()
+    from custom_components.pella_insynctive.proxy import BridgeProxy
+
+    async def _main() -> int:
+        async def _unused(cmd: str) -> str:
+            return ""
+
+        proxy = BridgeProxy("127.0.0.1", _free_port(), query=_unused, send=_unused, max_buffer=1024)
+        await proxy.start()
+        _reader, writer = await asyncio.open_connection("127.0.0.1", proxy._port)
+        while proxy.client_count == 0:
+            await asyncio.sleep(0.01)
+        line = "POINTSTATUS-001,$01" + " " * 1000
+        for _ in range(200):
+            for _ in range(100):
+                proxy.broadcast(line)
+            await asyncio.sleep(0)
+            if proxy.client_count == 0:
+                break
+        await asyncio.sleep(0.05)
+        count = proxy.client_count
+        writer.close()
+        await proxy.stop()
+        return count
+
+    assert asyncio.run(_main()) == 0
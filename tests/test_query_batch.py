@@ -0,0 +1,44 @@
+"""The query service keeps replies paired with their commands in mixed batches."""
+from __future__ import annotations
+
+import asyncio
+import tempfile
+
+import pytest
+from soak import DOMAIN, FakeBridge, async_add_entry, async_make_hass, async_wait_discovered
+
+OPTIONS = {"poll_interval_seconds": 0, "battery_poll_minutes": 0, "send_rate_max": 0}
+COMMANDS = ["!POINTSET-001,$10", "?POINTID-002", "!POINTSET-003,$20", "?POINTDEVICE-003", "?POINTBATTERYGET-004"]
+
+
+def _run_batch(bridge: FakeBridge, commands: list[str]) -> list[dict]:
+    async def _main() -> list[dict]:
+        server = await asyncio.start_server(bridge.handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        with tempfile.TemporaryDirectory() as config_dir:
+            hass = await async_make_hass(config_dir)
+            entry = await async_add_entry(hass, port, OPTIONS)
+            await async_wait_discovered(hass, entry)
+            response = await hass.services.async_call(
+                DOMAIN, "query", {"commands": commands}, blocking=True, return_response=True
+            )
+            await hass.async_stop(force=True)
+        server.close()
+        bridge.drop()
+        await server.wait_closed()
+        return response["responses"]
+
+    return asyncio.run(_main())
+
+
+@pytest.mark.parametrize("set_reply", [None, "OK"])
+def test_mixed_batch_pairs_replies(set_reply: str | None) -> None:
+    bridge = FakeBridge(4, set_reply=set_reply)
+    results = _run_batch(bridge, COMMANDS)
+
+    assert [r["command"] for r in results] == COMMANDS
+    assert all(r["error"] is None for r in results), results
+    assert [r["raw"] for r in results] == [set_reply, "S98A002", set_reply, "$0D", "$5A"]
+    assert results[1]["parsed"] == "S98A002"
+    assert results[3]["parsed"] == 0x0D
+    assert [cmd for cmd in bridge.received if cmd.startswith("!")] == ["!POINTSET-001,$10", "!POINTSET-003,$20"]